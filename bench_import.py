@@ -0,0 +1,40 @@
+import sys
+import time
+import statistics
+import subprocess
+
+# Comandos medidos: cada um roda em um interpretador novo (import "frio")
+COMANDOS = {
+    "python (vazio)": "pass",
+    "import nheengatu.cli": "import nheengatu.cli",
+    "nheengatu normalize": "from nheengatu.cli import main; main(['normalize', \"Nhe'eng\"])",
+    "import nheengatu.normalizer": "import nheengatu.normalizer",
+    "import nheengatu.variant_discovery": "import nheengatu.variant_discovery",
+    "import nheengatu.pipeline_v2_augment": "import nheengatu.pipeline_v2_augment",
+    "import torch": "import torch",
+    "import transformers": "import transformers",
+    "import nheengatu.extraction_script": "import nheengatu.extraction_script",
+}
+REPETICOES = 5
+
+def medir(codigo, repeticoes=REPETICOES):
+    """Mediana (ms) do tempo de parede de `python -c codigo`, ou None se falhar."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = subprocess.run([sys.executable, "-c", codigo], capture_output=True)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+        if resultado.returncode != 0:
+            return None
+    return statistics.median(tempos)
+
+def main():
+    print(f"{'Comando':<38} | {'Mediana (ms)':>12}")
+    print("-" * 54)
+    for nome, codigo in COMANDOS.items():
+        tempo = medir(codigo)
+        valor = f"{tempo:12.1f}" if tempo is not None else f"{'indisponível':>12}"
+        print(f"{nome:<38} | {valor}")
+
+if __name__ == "__main__":
+    main()
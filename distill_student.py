@@ -0,0 +1,6 @@
+"""Atalho para `python distill_student.py`: o código está em nheengatu/distill_student.py."""
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("nheengatu.distill_student", run_name="__main__")
+else:
+    from nheengatu.distill_student import *  # noqa: F401,F403
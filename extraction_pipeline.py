@@ -0,0 +1,6 @@
+"""Atalho para `python extraction_pipeline.py`: o código está em nheengatu/extraction_pipeline.py."""
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("nheengatu.extraction_pipeline", run_name="__main__")
+else:
+    from nheengatu.extraction_pipeline import *  # noqa: F401,F403
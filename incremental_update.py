@@ -0,0 +1,6 @@
+"""Atalho para `python incremental_update.py`: o código está em nheengatu/incremental_update.py."""
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("nheengatu.incremental_update", run_name="__main__")
+else:
+    from nheengatu.incremental_update import *  # noqa: F401,F403
@@ -0,0 +1,6 @@
+"""Atalho para `python inference_backends.py`: o código está em nheengatu/inference_backends.py."""
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("nheengatu.inference_backends", run_name="__main__")
+else:
+    from nheengatu.inference_backends import *  # noqa: F401,F403
@@ -0,0 +1,6 @@
+"""Atalho para `python ingest_directory.py`: o código está em nheengatu/ingest_directory.py."""
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("nheengatu.ingest_directory", run_name="__main__")
+else:
+    from nheengatu.ingest_directory import *  # noqa: F401,F403
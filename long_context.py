@@ -0,0 +1,6 @@
+"""Atalho para `python long_context.py`: o código está em nheengatu/long_context.py."""
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("nheengatu.long_context", run_name="__main__")
+else:
+    from nheengatu.long_context import *  # noqa: F401,F403
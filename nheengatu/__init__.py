@@ -0,0 +1,6 @@
+"""
+Ferramentas computacionais para o Nheengatu (PIBIC 2025-2026).
+
+Os módulos não são importados aqui: `import nheengatu` continua leve, e cada
+etapa do pipeline carrega torch/transformers apenas quando é usada.
+"""
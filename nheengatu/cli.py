@@ -0,0 +1,257 @@
+"""
+CLI única do pipeline Nheengatu (comando `nheengatu`).
+
+Cada subcomando importa seu módulo apenas quando é executado: tarefas rápidas
+(normalize, variants) não pagam os segundos de import de torch/transformers.
+Não adicione imports pesados no topo deste arquivo.
+"""
+import sys
+import argparse
+
+def _definidos(**kwargs):
+    """Repassa apenas as opções informadas; as demais usam as constantes de cada script."""
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+def cmd_normalize(args):
+    from .normalizer import clean_text_nheengatu
+
+    if args.palavras:
+        linhas = args.palavras
+    elif args.arquivo:
+        with open(args.arquivo, 'r', encoding='utf-8') as f:
+            linhas = f.read().splitlines()
+    else:
+        linhas = sys.stdin.read().splitlines()
+
+    for linha in linhas:
+        print(clean_text_nheengatu(linha))
+
+def cmd_ingest(args):
+    from . import ingest_data
+    ingest_data.ingest_data(**_definidos(arquivo_entrada=args.entrada, arquivo_saida=args.saida))
+
+def cmd_ingest_dir(args):
+    from . import ingest_directory
+    ingest_directory.ingerir_pasta(**_definidos(pasta=args.pasta, arquivo_saida=args.saida,
+                                                arquivo_relatorio=args.relatorio, max_workers=args.workers))
+
+def cmd_tokenize(args):
+    from . import run_pipeline
+    run_pipeline.main(**_definidos(arquivo_entrada=args.entrada, arquivo_saida_json=args.saida))
+
+def cmd_expand(args):
+    from . import pipeline_v2_augment
+    pipeline_v2_augment.main(**_definidos(arquivo_entrada=args.entrada, saida_json=args.saida_json, saida_csv=args.saida_csv))
+
+def cmd_extract(args):
+    opcoes = _definidos(backend=args.backend, input_file=args.entrada, output_file=args.saida)
+    if args.prefetch:
+        from . import extraction_pipeline
+        extraction_pipeline.main(**opcoes, **_definidos(batch_size=args.batch_size))
+    else:
+        from . import extraction_script
+        extraction_script.main(**opcoes)
+
+def cmd_validate(args):
+    from . import cosine_validation
+    cosine_validation.main(**_definidos(input_file=args.entrada, output_report=args.saida))
+
+def cmd_visualize(args):
+    from . import visualize_embeddings
+    data = visualize_embeddings.load_data(**_definidos(input_file=args.entrada))
+    if data:
+        saida = _definidos(output_dir=args.pasta_saida)
+        visualize_embeddings.plot_token_distribution(data, **saida)
+        visualize_embeddings.plot_embeddings_2d(data, **saida)
+
+def cmd_backends(args):
+    from . import inference_backends
+    inference_backends.relatorio_paridade(**_definidos(backends=args.backends, dataset_file=args.entrada,
+                                                        output_report=args.saida, limite=args.limite,
+                                                        reexportar=args.reexportar,
+                                                        output_cossenos=args.saida_cossenos))
+
+def cmd_align(args):
+    from . import train_alignment
+    train_alignment.main(**_definidos(input_file=args.entrada, cache_dir=args.cache, output_projection=args.saida,
+                                      arquitetura=args.arquitetura, epocas=args.epocas, paciencia=args.paciencia))
+
+def cmd_variants(args):
+    from . import variant_discovery
+    variant_discovery.main(**_definidos(input_file=args.entrada, output_json=args.saida_json, output_csv=args.saida_csv))
+
+def cmd_pll(args):
+    from . import pll_scoring
+    pll_scoring.main(**_definidos(input_file=args.entrada, output_file=args.saida, max_tokens=args.max_tokens))
+
+def cmd_update(args):
+    from . import incremental_update
+    incremental_update.atualizar(**_definidos(arquivo_entrada=args.entrada, saida_json=args.saida_json,
+                                              arquivo_embeddings=args.embeddings, arquivo_estado=args.estado,
+                                              backend=args.backend))
+
+def cmd_extract_long(args):
+    from . import long_context
+    long_context.main(**_definidos(corpus_file=args.corpus, dataset_file=args.entrada, output_file=args.saida,
+                                   estrategia=args.estrategia, backend=args.backend))
+
+def cmd_distill(args):
+    from . import distill_student
+    distill_student.destilar(**_definidos(tiny=args.tiny, dataset_file=args.entrada, corpus_texto=args.corpus,
+                                          pasta_estudante=args.saida, output_report=args.relatorio, camadas=args.camadas,
+                                          dim_oculta=args.dim_oculta, epocas=args.epocas))
+
+def cmd_static_table(args):
+    from . import static_embeddings
+    for lado in args.lados or list(static_embeddings.LADOS):
+        static_embeddings.construir_tabela(**_definidos(input_files=args.entradas, lado=lado, prefixo_saida=args.prefixo))
+
+def cmd_inspect_model(args):
+    from . import load_model
+    load_model.load_and_inspect()
+
+def cmd_compare_tokenizers(args):
+    from . import analyze_tokens
+    analyze_tokens.analyze_tokens()
+
+def cmd_unicode(args):
+    from . import explore_unicode
+    for texto in args.textos:
+        explore_unicode.analyze_string(texto, "Original")
+        nfc = explore_unicode.normalize_to_nfc(texto)
+        if nfc != texto:
+            explore_unicode.analyze_string(nfc, "NFC")
+
+def construir_parser():
+    # Sem valores padrão aqui: opções omitidas usam as constantes de cada script
+    parser = argparse.ArgumentParser(prog="nheengatu", description="Pipeline computacional para o Nheengatu.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("normalize", help="Normaliza palavras (NFC, lowercase, pontuação exceto glotal).")
+    p.add_argument("palavras", nargs="*", help="Palavras a normalizar (padrão: lê da entrada padrão).")
+    p.add_argument("-a", "--arquivo", help="Arquivo texto com uma palavra por linha.")
+    p.set_defaults(func=cmd_normalize)
+
+    p = sub.add_parser("ingest", help="Converte uma planilha em Hugging Face Dataset.")
+    p.add_argument("-e", "--entrada")
+    p.add_argument("-s", "--saida")
+    p.set_defaults(func=cmd_ingest)
+
+    p = sub.add_parser("ingest-dir", help="Mescla todas as planilhas de uma pasta (em paralelo).")
+    p.add_argument("-p", "--pasta")
+    p.add_argument("-s", "--saida")
+    p.add_argument("-r", "--relatorio")
+    p.add_argument("-w", "--workers", type=int, help="Número de processos.")
+    p.set_defaults(func=cmd_ingest_dir)
+
+    p = sub.add_parser("tokenize", help="Relatório de tokenização 1 palavra - 1 significado (run_pipeline).")
+    p.add_argument("-e", "--entrada")
+    p.add_argument("-s", "--saida")
+    p.set_defaults(func=cmd_tokenize)
+
+    p = sub.add_parser("expand", help="Expande, normaliza e tokeniza a planilha bruta (pipeline_v2_augment).")
+    p.add_argument("-e", "--entrada")
+    p.add_argument("--saida-json")
+    p.add_argument("--saida-csv")
+    p.set_defaults(func=cmd_expand)
+
+    p = sub.add_parser("extract", help="Extrai embeddings Canarim/BERTimbau do dataset expandido.")
+    p.add_argument("-e", "--entrada")
+    p.add_argument("-s", "--saida")
+    p.add_argument("-b", "--backend", choices=["fp32", "int8", "bf16", "onnx"])
+    p.add_argument("--prefetch", action="store_true",
+                   help="Pipeline em estágios: tokenização, inferência em batch e escrita em paralelo.")
+    p.add_argument("--batch-size", type=int, help="Itens por batch (apenas com --prefetch).")
+    p.set_defaults(func=cmd_extract)
+
+    p = sub.add_parser("extract-long", help="Embeddings por ocorrência em documentos longos (janelas deslizantes).")
+    p.add_argument("-c", "--corpus", help="JSON com a lista de documentos {id, texto}.")
+    p.add_argument("-e", "--entrada", help="Dataset expandido com as palavras-alvo.")
+    p.add_argument("-s", "--saida")
+    p.add_argument("--estrategia", choices=["centro", "media"])
+    p.add_argument("-b", "--backend", choices=["fp32", "int8", "bf16", "onnx"])
+    p.set_defaults(func=cmd_extract_long)
+
+    p = sub.add_parser("validate", help="Similaridade de cosseno entre os pares extraídos.")
+    p.add_argument("-e", "--entrada")
+    p.add_argument("-s", "--saida")
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser("visualize", help="Gera os gráficos de distribuição, PCA e t-SNE.")
+    p.add_argument("-e", "--entrada")
+    p.add_argument("-p", "--pasta-saida")
+    p.set_defaults(func=cmd_visualize)
+
+    p = sub.add_parser("backends", help="Relatório de paridade/throughput dos backends de inferência.")
+    p.add_argument("-e", "--entrada")
+    p.add_argument("-s", "--saida")
+    p.add_argument("-b", "--backends", nargs="+", choices=["fp32", "int8", "bf16", "onnx"])
+    p.add_argument("-n", "--limite", type=int, help="Usa apenas os N primeiros itens.")
+    p.add_argument("--saida-cossenos", help="CSV com o cosseno de cada texto em relação ao fp32.")
+    p.add_argument("--reexportar", action="store_true", help="Exporta o grafo ONNX novamente, ignorando o cache.")
+    p.set_defaults(func=cmd_backends)
+
+    p = sub.add_parser("align", help="Treina a projeção de alinhamento sobre os embeddings em cache.")
+    p.add_argument("-e", "--entrada")
+    p.add_argument("-c", "--cache")
+    p.add_argument("-s", "--saida")
+    p.add_argument("--arquitetura", choices=["linear", "mlp"])
+    p.add_argument("--epocas", type=int)
+    p.add_argument("--paciencia", type=int)
+    p.set_defaults(func=cmd_align)
+
+    p = sub.add_parser("variants", help="Descobre variantes ortográficas no léxico.")
+    p.add_argument("-e", "--entrada")
+    p.add_argument("--saida-json")
+    p.add_argument("--saida-csv")
+    p.set_defaults(func=cmd_variants)
+
+    p = sub.add_parser("pll", help="Ranqueia variantes pela pseudo-log-verossimilhança do Canarim (MLM).")
+    p.add_argument("-e", "--entrada")
+    p.add_argument("-s", "--saida")
+    p.add_argument("--max-tokens", type=int, help="Orçamento de tokens (batch x comprimento) por forward.")
+    p.set_defaults(func=cmd_pll)
+
+    p = sub.add_parser("update", help="Reprocessa apenas as linhas da planilha que mudaram desde a última execução.")
+    p.add_argument("-e", "--entrada")
+    p.add_argument("--saida-json")
+    p.add_argument("--embeddings")
+    p.add_argument("--estado")
+    p.add_argument("-b", "--backend", choices=["fp32", "int8", "bf16", "onnx"])
+    p.set_defaults(func=cmd_update)
+
+    p = sub.add_parser("distill", help="Destila o Canarim em um estudante menor e mais rápido.")
+    p.add_argument("-e", "--entrada", help="Dataset expandido.")
+    p.add_argument("-c", "--corpus", help="Texto Nheengatu não rotulado (.txt).")
+    p.add_argument("-s", "--saida", help="Pasta do modelo estudante.")
+    p.add_argument("-r", "--relatorio", help="JSON do relatório de destilação.")
+    p.add_argument("--camadas", type=int)
+    p.add_argument("--dim-oculta", type=int)
+    p.add_argument("--epocas", type=int)
+    p.add_argument("--tiny", action="store_true", help="Modelos minúsculos e aleatórios, 100%% offline (teste).")
+    p.set_defaults(func=cmd_distill)
+
+    p = sub.add_parser("static-table", help="Constrói a tabela de embeddings estáticos por tipo de palavra.")
+    p.add_argument("-e", "--entradas", nargs="+", help="JSONs de embeddings contextuais.")
+    p.add_argument("-p", "--prefixo")
+    p.add_argument("-l", "--lados", nargs="+", choices=["yrl", "pt"])
+    p.set_defaults(func=cmd_static_table)
+
+    p = sub.add_parser("inspect-model", help="Carrega o Canarim e mostra como ele tokeniza palavras de teste (load_model).")
+    p.set_defaults(func=cmd_inspect_model)
+
+    p = sub.add_parser("compare-tokenizers", help="Compara a tokenização do Canarim e do XLM-R (analyze_tokens).")
+    p.set_defaults(func=cmd_compare_tokenizers)
+
+    p = sub.add_parser("unicode", help="Mostra os code points de cada caractere, antes e depois do NFC (explore_unicode).")
+    p.add_argument("textos", nargs="+")
+    p.set_defaults(func=cmd_unicode)
+
+    return parser
+
+def main(argv=None):
+    args = construir_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
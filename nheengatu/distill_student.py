@@ -0,0 +1,300 @@
+import os
+import json
+import time
+import types
+import tempfile
+import numpy as np
+import torch
+import torch.nn.functional as F
+from transformers import AutoTokenizer, AutoModel, BertConfig, BertModel, BertTokenizerFast
+from .normalizer import clean_text_nheengatu
+from .extraction_script import device, MODELS_CONFIG, load_model_and_tokenizer
+
+# Configuração de Entrada/Saída
+DATASET_FILE = "dataset_nheengatu_expandido.json"
+EMBEDDINGS_FILE = "embeddings_extraidos.json"
+CORPUS_TEXTO = "corpus_nheengatu.txt"         # texto Nheengatu não rotulado (opcional)
+PASTA_ESTUDANTE = "modelo_estudante"
+OUTPUT_REPORT = "relatorio_destilacao.json"
+# Saídas do modo --tiny: o estudante aleatório de teste nunca sobrescreve um estudante treinado
+PASTA_ESTUDANTE_TINY = "modelo_estudante_tiny"
+OUTPUT_REPORT_TINY = "relatorio_destilacao_tiny.json"
+
+CONFIG_DESTILACAO = {
+    "camadas": 4,          # camadas do estudante (o Canarim tem 12)
+    "dim_oculta": None,    # None = mesma largura do professor (camadas copiadas dele)
+    "batch_size": 64,
+    "epocas": 30,
+    "lr": 5e-5,
+    "frac_teste": 0.1,
+    "seed": 42,
+}
+
+# Usadas pelo modo --tiny quando não há dataset nem corpus disponíveis
+PALAVRAS_EXEMPLO = ["nheengatu", "tata", "paranã", "yauareté", "mba'e", "ara", "tukũ", "yapukuĩ",
+                    "nhe'eng", "kĩdara", "cuára", "kuara", "darápe", "anga", "katuçawa", "piranha",
+                    "yara", "kunhã", "apigawa", "mirĩ", "uka", "yasí", "kwarasí", "ygara"]
+
+class StudentEncoder(torch.nn.Module):
+    """
+    BERT menor + projeção linear para a dimensão do professor (768).
+    A projeção é aplicada por token: como o mean pooling é linear, o vetor
+    de get_word_embedding sai direto no espaço do Canarim.
+    """
+    def __init__(self, bert, dim_professor):
+        super().__init__()
+        self.bert = bert
+        self.config = bert.config
+        self.projecao = torch.nn.Linear(bert.config.hidden_size, dim_professor)
+
+    def forward(self, input_ids=None, attention_mask=None, **kwargs):
+        hidden = self.bert(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+        return types.SimpleNamespace(last_hidden_state=self.projecao(hidden))
+
+def criar_estudante(professor, camadas=4, dim_oculta=None):
+    """
+    Cria o estudante a partir da configuração do professor. Com a mesma largura,
+    copia embeddings e camadas igualmente espaçadas do professor (inicialização
+    muito melhor que aleatória); com largura menor, inicia do zero.
+    """
+    cfg = professor.config.to_dict()
+    cfg["num_hidden_layers"] = camadas
+    if dim_oculta:
+        cfg.update(hidden_size=dim_oculta, intermediate_size=4 * dim_oculta,
+                   num_attention_heads=max(1, dim_oculta // 64))
+    bert = BertModel(BertConfig(**cfg), add_pooling_layer=False)
+
+    if not dim_oculta:
+        total = professor.config.num_hidden_layers
+        escolhidas = np.linspace(0, total - 1, camadas).round().astype(int).tolist()
+        bert.embeddings.load_state_dict(professor.embeddings.state_dict())
+        for destino, origem in enumerate(escolhidas):
+            bert.encoder.layer[destino].load_state_dict(professor.encoder.layer[origem].state_dict())
+        print(f"Estudante inicializado com as camadas {escolhidas} do professor.")
+
+    return StudentEncoder(bert, professor.config.hidden_size)
+
+def codificar_lote(palavras, tokenizer):
+    """Tokeniza um lote de palavras com padding e marca os tokens que entram no pooling."""
+    enc = tokenizer(palavras, return_tensors="pt", padding=True, truncation=True)
+    especiais = torch.tensor([tokenizer.get_special_tokens_mask(ids, already_has_special_tokens=True)
+                              for ids in enc["input_ids"].tolist()], dtype=torch.bool)
+    mascara = enc["attention_mask"].bool() & ~especiais
+    return enc["input_ids"], enc["attention_mask"], mascara
+
+def pooling(last_hidden_state, mascara):
+    """Mean pooling dos subwords (sem [CLS]/[SEP]), como em get_word_embedding."""
+    pesos = mascara.unsqueeze(-1).to(last_hidden_state.dtype)
+    return (last_hidden_state * pesos).sum(dim=1) / pesos.sum(dim=1).clamp(min=1)
+
+def embeddings_em_lote(palavras, tokenizer, model, batch_size=64):
+    """
+    Vetor de cada palavra isolada, em lotes. Para palavra == contexto, equivale
+    a get_word_embedding(palavra, palavra, ...), porém sem um forward por palavra.
+    """
+    vetores = []
+    with torch.no_grad():
+        for i in range(0, len(palavras), batch_size):
+            input_ids, attention_mask, mascara = codificar_lote(palavras[i:i + batch_size], tokenizer)
+            hidden = model(input_ids.to(device), attention_mask=attention_mask.to(device)).last_hidden_state
+            vetores.append(pooling(hidden, mascara.to(device)).float().cpu())
+    return torch.cat(vetores).numpy() if vetores else np.zeros((0, 0), dtype=np.float32)
+
+def coletar_palavras(dataset, corpus_texto=CORPUS_TEXTO):
+    """Palavras do dataset expandido + tipos do texto não rotulado (normalizados)."""
+    palavras = {item['nheengatu_text'] for item in dataset if item.get('nheengatu_text')}
+    if corpus_texto and os.path.exists(corpus_texto):
+        with open(corpus_texto, 'r', encoding='utf-8') as f:
+            for linha in f:
+                palavras.update(clean_text_nheengatu(linha).split())
+    return sorted(palavras)
+
+def _procrustes(x, y):
+    """Rotação ortogonal W que minimiza ||xW - y|| (Orthogonal Procrustes)."""
+    u, _, vt = np.linalg.svd(x.T @ y)
+    return u @ vt
+
+def qualidade_alinhamento(vec_yrl, vec_pt, idx_treino, idx_teste):
+    """Recall@1 / MRR da busca Nheengatu -> Português após Procrustes ajustado no treino."""
+    from .train_alignment import metricas_recuperacao
+
+    if vec_yrl.shape[1] != vec_pt.shape[1] or not idx_treino or not idx_teste:
+        return None
+    w = _procrustes(vec_yrl[idx_treino], vec_pt[idx_treino])
+    return metricas_recuperacao(torch.from_numpy(vec_yrl[idx_teste] @ w), torch.from_numpy(vec_pt[idx_teste]))
+
+def medir_throughput(palavras, tokenizer, model, batch_size, repeticoes=3):
+    """Palavras por segundo (melhor de N repetições)."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        embeddings_em_lote(palavras, tokenizer, model, batch_size)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return len(palavras) / melhor
+
+def modelos_tiny(palavras):
+    """
+    Professor/BERTimbau minúsculos e aleatórios + tokenizer de caracteres,
+    criados localmente: permite testar todo o pipeline offline.
+    """
+    caracteres = sorted({c for p in palavras for c in p if not c.isspace()})
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + caracteres + [f"##{c}" for c in caracteres]
+    # O tokenizer rápido guarda o vocabulário em memória: a pasta temporária é apagada em seguida
+    with tempfile.TemporaryDirectory(prefix="nheengatu_tiny_") as pasta:
+        with open(os.path.join(pasta, "vocab.txt"), 'w', encoding='utf-8') as f:
+            f.write("\n".join(vocab))
+        tokenizer = BertTokenizerFast(os.path.join(pasta, "vocab.txt"), do_lower_case=False, strip_accents=False)
+
+    config = BertConfig(vocab_size=len(vocab), hidden_size=64, num_hidden_layers=4, num_attention_heads=4,
+                        intermediate_size=128, max_position_embeddings=128)
+    torch.manual_seed(0)
+    professor = BertModel(config, add_pooling_layer=False).to(device).eval()
+    portugues = BertModel(config, add_pooling_layer=False).to(device).eval()
+    return tokenizer, professor, tokenizer, portugues
+
+def destilar(tiny=False, dataset_file=DATASET_FILE, embeddings_file=EMBEDDINGS_FILE, corpus_texto=CORPUS_TEXTO,
+             pasta_estudante=None, output_report=None, **overrides):
+    """
+    Treina o estudante para reproduzir os embeddings de palavra do Canarim e
+    gera o relatório de speedup, cosseno estudante-professor e alinhamento.
+    Sem pasta/relatório informados, o modo tiny usa saídas próprias (sufixo _tiny).
+    """
+    pasta_estudante = pasta_estudante or (PASTA_ESTUDANTE_TINY if tiny else PASTA_ESTUDANTE)
+    output_report = output_report or (OUTPUT_REPORT_TINY if tiny else OUTPUT_REPORT)
+    config = {**CONFIG_DESTILACAO, **overrides}
+    torch.manual_seed(config["seed"])
+
+    dataset = []
+    if os.path.exists(dataset_file):
+        with open(dataset_file, 'r', encoding='utf-8') as f:
+            dataset = json.load(f)
+    palavras = coletar_palavras(dataset, corpus_texto)
+
+    if tiny:
+        palavras = palavras or sorted(set(PALAVRAS_EXEMPLO))
+        dataset = dataset or [{"nheengatu_text": p, "portuguese_text": p} for p in palavras]
+        config.update(camadas=min(config["camadas"], 2), epocas=min(config["epocas"], 5))
+        tokenizer, professor, tokenizer_pt, model_pt = modelos_tiny(palavras + [i["portuguese_text"] for i in dataset])
+    else:
+        if not palavras:
+            print(f"❌ Nenhuma palavra encontrada ('{dataset_file}' / '{corpus_texto}').")
+            return None
+        tokenizer, professor = load_model_and_tokenizer(MODELS_CONFIG['nheengatu'])
+        tokenizer_pt, model_pt = None, None
+
+    # Divisão treino/teste por tipo de palavra
+    rng = np.random.default_rng(config["seed"])
+    permutacao = rng.permutation(len(palavras))
+    n_teste = max(1, int(len(palavras) * config["frac_teste"]))
+    teste = [palavras[i] for i in permutacao[:n_teste]]
+    treino = [palavras[i] for i in permutacao[n_teste:]]
+
+    print(f"--- Alvos do professor para {len(palavras)} palavras ({len(treino)} treino / {len(teste)} teste) ---")
+    alvos = dict(zip(palavras, embeddings_em_lote(palavras, tokenizer, professor, config["batch_size"])))
+
+    estudante = criar_estudante(professor, config["camadas"], config["dim_oculta"]).to(device)
+    estudante.train()
+    otimizador = torch.optim.AdamW(estudante.parameters(), lr=config["lr"])
+
+    print(f"🚀 Destilando: {professor.config.num_hidden_layers} -> {config['camadas']} camadas...")
+    for epoca in range(1, config["epocas"] + 1):
+        ordem = rng.permutation(len(treino))
+        perda_total, n_lotes = 0.0, 0
+        for i in range(0, len(ordem), config["batch_size"]):
+            lote = [treino[j] for j in ordem[i:i + config["batch_size"]]]
+            input_ids, attention_mask, mascara = codificar_lote(lote, tokenizer)
+            alvo = torch.from_numpy(np.stack([alvos[p] for p in lote])).to(device)
+
+            hidden = estudante(input_ids.to(device), attention_mask=attention_mask.to(device)).last_hidden_state
+            pred = pooling(hidden, mascara.to(device))
+            # Direção (cosseno) + magnitude (MSE) do vetor do professor
+            perda = (1 - F.cosine_similarity(pred, alvo, dim=-1)).mean() + F.mse_loss(pred, alvo)
+
+            otimizador.zero_grad()
+            perda.backward()
+            otimizador.step()
+            perda_total += perda.item()
+            n_lotes += 1
+        print(f"Época {epoca:>3} | perda={perda_total / max(1, n_lotes):.4f}")
+    estudante.eval()
+
+    # --- Relatório ---
+    vec_prof_teste = np.stack([alvos[p] for p in teste])
+    vec_est_teste = embeddings_em_lote(teste, tokenizer, estudante, config["batch_size"])
+    cossenos = F.cosine_similarity(torch.from_numpy(vec_est_teste), torch.from_numpy(vec_prof_teste), dim=-1)
+
+    tps_prof = medir_throughput(palavras, tokenizer, professor, config["batch_size"])
+    tps_est = medir_throughput(palavras, tokenizer, estudante, config["batch_size"])
+
+    # Alinhamento: Procrustes Nheengatu -> Português com vetores do professor vs do estudante
+    alinhamento = None
+    pares = [i for i in dataset if i.get('nheengatu_text') and i.get('portuguese_text')]
+    if pares:
+        if tokenizer_pt is None and os.path.exists(embeddings_file):
+            with open(embeddings_file, 'r', encoding='utf-8') as f:
+                vec_pt = {(e['nheengatu_text'], e['portuguese_text']): e['vetor_pt'] for e in json.load(f)}
+            pares = [i for i in pares if (i['nheengatu_text'], i['portuguese_text']) in vec_pt]
+            pt = np.asarray([vec_pt[(i['nheengatu_text'], i['portuguese_text'])] for i in pares], dtype=np.float32)
+        elif tokenizer_pt is not None:
+            pt = embeddings_em_lote([i['portuguese_text'] for i in pares], tokenizer_pt, model_pt, config["batch_size"])
+        else:
+            pt = None
+            print(f"⚠️ '{embeddings_file}' não encontrado: qualidade de alinhamento não avaliada.")
+
+        if pt is not None and len(pares) > 1:
+            conj_teste = set(teste)
+            idx_teste = [k for k, i in enumerate(pares) if i['nheengatu_text'] in conj_teste]
+            idx_treino = [k for k, i in enumerate(pares) if i['nheengatu_text'] not in conj_teste]
+            yrl_prof = np.stack([alvos[i['nheengatu_text']] for i in pares])
+            yrl_est = embeddings_em_lote([i['nheengatu_text'] for i in pares], tokenizer, estudante, config["batch_size"])
+            alinhamento = {
+                "professor": qualidade_alinhamento(yrl_prof, pt, idx_treino, idx_teste),
+                "estudante": qualidade_alinhamento(yrl_est, pt, idx_treino, idx_teste),
+            }
+
+    relatorio = {
+        "modo": "tiny" if tiny else "canarim",
+        "config": config,
+        "parametros_professor": sum(p.numel() for p in professor.parameters()),
+        "parametros_estudante": sum(p.numel() for p in estudante.parameters()),
+        "palavras_por_s_professor": tps_prof,
+        "palavras_por_s_estudante": tps_est,
+        "speedup": tps_est / tps_prof,
+        "cosseno_estudante_professor_medio": float(cossenos.mean()),
+        "cosseno_estudante_professor_minimo": float(cossenos.min()),
+        "alinhamento_teste": alinhamento,
+    }
+
+    # Exporta o estudante (compatível com get_word_embedding via carregar_estudante)
+    os.makedirs(pasta_estudante, exist_ok=True)
+    estudante.bert.save_pretrained(pasta_estudante)
+    tokenizer.save_pretrained(pasta_estudante)
+    torch.save(estudante.projecao.state_dict(), os.path.join(pasta_estudante, "projecao.pt"))
+
+    with open(output_report, 'w', encoding='utf-8') as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=2)
+
+    print("\n" + "="*40)
+    print("RELATÓRIO DE DESTILAÇÃO")
+    print("="*40)
+    print(f"Parâmetros: {relatorio['parametros_professor']:,} -> {relatorio['parametros_estudante']:,}")
+    print(f"Throughput: {tps_prof:.1f} -> {tps_est:.1f} palavras/s (speedup {relatorio['speedup']:.2f}x)")
+    print(f"Cosseno estudante-professor (teste): média {cossenos.mean():.4f} | mínimo {cossenos.min():.4f}")
+    if alinhamento and alinhamento["professor"]:
+        for nome in ("professor", "estudante"):
+            m = alinhamento[nome]
+            print(f"Alinhamento ({nome}): R@1={m['recall@1']:.3f} MRR={m['mrr']:.3f}")
+    print(f"\n✅ Estudante salvo em '{pasta_estudante}' | relatório em '{output_report}'")
+    return relatorio
+
+def carregar_estudante(pasta=PASTA_ESTUDANTE):
+    """Carrega (tokenizer, modelo) do estudante, prontos para get_word_embedding."""
+    tokenizer = AutoTokenizer.from_pretrained(pasta)
+    bert = AutoModel.from_pretrained(pasta, add_pooling_layer=False)
+    projecao = torch.load(os.path.join(pasta, "projecao.pt"), map_location="cpu")
+    estudante = StudentEncoder(bert, projecao["weight"].shape[0])
+    estudante.projecao.load_state_dict(projecao)
+    return tokenizer, estudante.to(device).eval()
+
+if __name__ == "__main__":
+    destilar()
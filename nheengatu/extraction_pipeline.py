@@ -0,0 +1,208 @@
+import copy
+import json
+import time
+import queue
+import threading
+import numpy as np
+import torch
+from .extraction_script import (device, BACKEND, INPUT_FILE, OUTPUT_FILE, MODELS_CONFIG,
+                               load_model_and_tokenizer, get_word_embedding)
+from .long_context import limite_tokens
+
+# Itens por batch e tamanho das filas entre os estágios (batches)
+BATCH_SIZE = 32
+TAMANHO_FILA = 4
+
+_FIM = object()  # Sentinela: o estágio anterior terminou
+
+class Estagio(threading.Thread):
+    """Thread de um estágio: mede o tempo ocupado (sem contar a espera nas filas)."""
+    def __init__(self, nome, alvo):
+        super().__init__(name=nome, daemon=True)
+        self.alvo = alvo
+        self.ocupado = 0.0
+        self.erro = None
+
+    def run(self):
+        try:
+            self.alvo(self)
+        except Exception as e:
+            self.erro = e
+
+def preparar_item(text, target_word, tokenizer, limite):
+    """
+    Mesma lógica de get_word_embedding, sem o modelo: retorna (input_ids, índices
+    dos tokens do alvo), ou None para vetor zerado, ou 'direto' para contextos
+    longos (que seguem por get_word_embedding / janelas deslizantes).
+    """
+    if not text or not target_word:
+        return None
+
+    encoded = tokenizer(text, return_offsets_mapping=True, add_special_tokens=True)
+    if len(encoded["input_ids"]) > limite:
+        return "direto"
+
+    start_char = text.lower().find(target_word.lower())
+    if start_char != -1:
+        end_char = start_char + len(target_word)
+        indices = [idx for idx, (start, end) in enumerate(encoded["offset_mapping"])
+                   if start != end and start >= start_char and end <= end_char]
+        if indices:
+            return encoded["input_ids"], indices
+
+    # Fallback (get_isolated_embedding): palavra fora de contexto, sem [CLS]/[SEP]
+    ids = tokenizer(target_word)["input_ids"]
+    indices = list(range(1, len(ids) - 1)) if len(ids) > 2 else list(range(len(ids)))
+    return ids, indices
+
+def montar_batch(preparados, pad_id):
+    """Tensores com padding + máscara de pooling para os itens que vão ao modelo."""
+    validos = [(i, p) for i, p in enumerate(preparados) if isinstance(p, tuple)]
+    if not validos:
+        return None
+    max_len = max(len(ids) for _, (ids, _) in validos)
+    input_ids = torch.full((len(validos), max_len), pad_id, dtype=torch.long)
+    attention_mask = torch.zeros((len(validos), max_len), dtype=torch.long)
+    pesos = torch.zeros((len(validos), max_len))
+    for linha, (_, (ids, indices)) in enumerate(validos):
+        input_ids[linha, :len(ids)] = torch.tensor(ids)
+        attention_mask[linha, :len(ids)] = 1
+        pesos[linha, indices] = 1.0
+    return [i for i, _ in validos], input_ids, attention_mask, pesos
+
+def extrair_com_prefetch(dataset, tokenizer_yrl, model_yrl, tokenizer_pt, model_pt, output_file=OUTPUT_FILE,
+                         batch_size=BATCH_SIZE, tamanho_fila=TAMANHO_FILA):
+    """
+    Extração em três estágios com filas limitadas:
+    tokenização (thread) -> inferência (thread principal) -> escrita (thread).
+    Enquanto o modelo roda um batch, o próximo já está sendo tokenizado e o
+    anterior está sendo convertido e gravado. Retorna a utilização de cada estágio.
+    """
+    # Tokenizers rápidos não podem ser usados por duas threads ao mesmo tempo ("Already borrowed"):
+    # o caminho 'direto' da inferência (janelas com truncation/stride) usa uma cópia própria
+    lados = [
+        ("nheengatu_text", tokenizer_yrl, copy.deepcopy(tokenizer_yrl), model_yrl, limite_tokens(tokenizer_yrl, model_yrl)),
+        ("portuguese_text", tokenizer_pt, copy.deepcopy(tokenizer_pt), model_pt, limite_tokens(tokenizer_pt, model_pt)),
+    ]
+    fila_tokens = queue.Queue(maxsize=tamanho_fila)
+    fila_vetores = queue.Queue(maxsize=tamanho_fila)
+
+    def tokenizar(estagio):
+        try:
+            for inicio in range(0, len(dataset), batch_size):
+                t0 = time.perf_counter()
+                itens = dataset[inicio:inicio + batch_size]
+                preparados_por_lado = []
+                for campo, tokenizer, _, _, limite in lados:
+                    # Sem contexto explícito no JSON: a própria palavra é o contexto
+                    preparados = [preparar_item(item.get(campo), item.get(campo), tokenizer, limite) for item in itens]
+                    pad_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else 0
+                    preparados_por_lado.append((preparados, montar_batch(preparados, pad_id)))
+                estagio.ocupado += time.perf_counter() - t0
+                fila_tokens.put((itens, preparados_por_lado))
+        finally:
+            # Mesmo com erro, libera a inferência (o erro é relançado no final)
+            fila_tokens.put(_FIM)
+
+    def escrever(estagio):
+        estagio.total = 0
+        lote = None
+        try:
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.write("[\n")
+                while True:
+                    lote = fila_vetores.get()
+                    if lote is _FIM:
+                        break
+                    t0 = time.perf_counter()
+                    itens, vetores_yrl, vetores_pt = lote
+                    for item, vec_yrl, vec_pt in zip(itens, vetores_yrl, vetores_pt):
+                        entrada = {
+                            "nheengatu_text": item.get('nheengatu_text'),
+                            "portuguese_text": item.get('portuguese_text'),
+                            "metadata": item.get('metadata', {}),
+                            "vetor_yrl": vec_yrl.tolist(),
+                            "vetor_pt": vec_pt.tolist()
+                        }
+                        f.write((",\n" if estagio.total else "") + json.dumps(entrada, ensure_ascii=False, indent=2))
+                        estagio.total += 1
+                    estagio.ocupado += time.perf_counter() - t0
+                f.write("\n]")
+        except Exception:
+            # Continua consumindo a fila para a inferência não travar no put()
+            while lote is not _FIM:
+                lote = fila_vetores.get()
+            raise
+
+    tokenizador = Estagio("tokenizacao", tokenizar)
+    escritor = Estagio("escrita", escrever)
+    inicio_total = time.perf_counter()
+    tokenizador.start()
+    escritor.start()
+
+    ocupado_inferencia = 0.0
+    try:
+        while True:
+            lote = fila_tokens.get()
+            if lote is _FIM:
+                break
+            t0 = time.perf_counter()
+            itens, preparados_por_lado = lote
+            saidas = []
+            for (campo, _, tokenizer_inferencia, model, _), (preparados, batch) in zip(lados, preparados_por_lado):
+                vetores = [None] * len(itens)
+                if batch is not None:
+                    posicoes, input_ids, attention_mask, pesos = batch
+                    with torch.no_grad():
+                        hidden = model(input_ids.to(device), attention_mask=attention_mask.to(device)).last_hidden_state
+                    pesos = pesos.to(hidden.device).unsqueeze(-1)
+                    pooled = ((hidden * pesos).sum(dim=1) / pesos.sum(dim=1)).cpu().numpy()
+                    for linha, i in enumerate(posicoes):
+                        vetores[i] = pooled[linha]
+                for i, preparado in enumerate(preparados):
+                    if preparado is None:
+                        vetores[i] = np.zeros(768) # Tamanho padrão do BERT
+                    elif preparado == "direto":
+                        texto = itens[i].get(campo)
+                        vetores[i] = get_word_embedding(texto, texto, tokenizer_inferencia, model)
+                saidas.append(vetores)
+            ocupado_inferencia += time.perf_counter() - t0
+            fila_vetores.put((itens, saidas[0], saidas[1]))
+    finally:
+        fila_vetores.put(_FIM)
+        escritor.join()
+        tokenizador.join(timeout=1)
+
+    for estagio in (tokenizador, escritor):
+        if estagio.erro:
+            raise estagio.erro
+
+    total = time.perf_counter() - inicio_total
+    utilizacao = {
+        "tokenizacao": tokenizador.ocupado / total,
+        "inferencia": ocupado_inferencia / total,
+        "escrita": escritor.ocupado / total,
+    }
+    print(f"✅ Sucesso! {escritor.total} embeddings salvos em {output_file} ({total:.1f}s).")
+    print("Utilização por estágio: " + " | ".join(f"{nome}: {u*100:.0f}%" for nome, u in utilizacao.items()))
+    return utilizacao
+
+def main(backend=BACKEND, input_file=INPUT_FILE, output_file=OUTPUT_FILE, batch_size=BATCH_SIZE):
+    try:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            dataset = json.load(f)
+    except FileNotFoundError:
+        print(f"Erro: {input_file} não encontrado.")
+        return
+
+    try:
+        tokenizer_yrl, model_yrl = load_model_and_tokenizer(MODELS_CONFIG['nheengatu'], backend)
+        tokenizer_pt, model_pt = load_model_and_tokenizer(MODELS_CONFIG['portugues'], backend)
+    except Exception:
+        return # Para execução se falhar o load
+
+    print(f"🚀 Iniciando extração em pipeline (batch={batch_size})...")
+    return extrair_com_prefetch(dataset, tokenizer_yrl, model_yrl, tokenizer_pt, model_pt, output_file, batch_size)
+
+if __name__ == "__main__":
+    main()
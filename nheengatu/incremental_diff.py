@@ -0,0 +1,66 @@
+"""
+Comparação entre execuções do incremental_update: quais linhas da planilha
+mudaram e como aplicar o resultado nos itens já salvos. Sem pandas/torch.
+"""
+import os
+
+def chave_linha(arquivo, linha):
+    """
+    Identificador de uma linha da planilha de origem. O caminho é normalizado:
+    'x.xlsx' e './x.xlsx' identificam a mesma planilha.
+    """
+    return f"{os.path.normcase(os.path.abspath(str(arquivo)))}:{linha}"
+
+def chave_item(item, arquivo_padrao=None):
+    """Chave da linha de origem de um item do dataset/embeddings."""
+    meta = item.get('metadata', {})
+    return chave_linha(meta.get('source_file', arquivo_padrao), meta.get('source_line'))
+
+def detectar_mudancas(hashes_atuais, hashes_anteriores):
+    """
+    Compara as linhas desta execução com as da anterior. Conteúdo já conhecido
+    em outra posição (ex: linhas deslocadas por uma inserção) conta como movido,
+    não como novo. Retorna (adicionadas, alteradas, removidas, movidas), com
+    movidas = {chave_antiga: chave_nova}.
+    """
+    inalteradas = {k for k, h in hashes_atuais.items() if hashes_anteriores.get(k) == h}
+
+    # Conteúdo das linhas antigas que não ficaram no mesmo lugar
+    livres = {}
+    for chave, h in hashes_anteriores.items():
+        if chave not in inalteradas:
+            livres.setdefault(h, []).append(chave)
+
+    adicionadas, alteradas, movidas = [], [], {}
+    for chave, h in hashes_atuais.items():
+        if chave in inalteradas:
+            continue
+        if livres.get(h):
+            movidas[livres[h].pop(0)] = chave
+        elif chave in hashes_anteriores:
+            alteradas.append(chave)
+        else:
+            adicionadas.append(chave)
+
+    # Conteúdo antigo que sumiu (inclusive de chaves que agora recebem outra linha movida)
+    removidas = [k for k in hashes_anteriores
+                 if k not in inalteradas and k not in movidas and k not in alteradas]
+    return adicionadas, alteradas, removidas, movidas
+
+def aplicar_patch(itens_antigos, itens_novos, chaves_afetadas, ordem, movidas=None, origens=None, arquivo_padrao=None):
+    """
+    Move para a nova origem os itens das linhas movidas (mantendo tokens e vetores),
+    remove os itens das demais linhas afetadas, insere os novos e reordena pela
+    ordem das linhas na planilha (a mesma de uma execução completa).
+    """
+    movidas = movidas or {}
+    mantidos = []
+    for item in itens_antigos:
+        chave = chave_item(item, arquivo_padrao)
+        if chave in movidas:
+            arquivo, linha = origens[movidas[chave]]
+            item.setdefault('metadata', {}).update(source_file=arquivo, source_line=linha)
+        elif chave in chaves_afetadas:
+            continue
+        mantidos.append(item)
+    return sorted(mantidos + itens_novos, key=lambda item: ordem.get(chave_item(item, arquivo_padrao), len(ordem)))
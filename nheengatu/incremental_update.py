@@ -0,0 +1,116 @@
+import os
+import json
+import hashlib
+from .pipeline_v2_augment import (ARQUIVO_ENTRADA_BRUTO, ARQUIVO_SAIDA_JSON, ARQUIVO_SAIDA_CSV, MODELO_NOME,
+                                 carregar_dados_brutos, processar_augmentacao, salvar_dataset)
+from .incremental_diff import chave_linha, detectar_mudancas, aplicar_patch
+
+# Configuração de Entrada/Saída
+ARQUIVO_EMBEDDINGS = "embeddings_extraidos.json"
+ARQUIVO_ESTADO = "estado_incremental.json"
+
+def origens_da_planilha(df):
+    """
+    (arquivo, linha) de cada linha da planilha, na ordem do DataFrame.
+    Usa a mesma regra de origem_linha de expandir_linha.
+    """
+    origens = {}
+    for _, row in df.iterrows():
+        linha = int(row['Linha']) if 'Linha' in row.index else row.name + 2
+        origens[chave_linha(row['Arquivo'], linha)] = (row['Arquivo'], linha)
+    return origens
+
+def hashes_da_planilha(df):
+    """
+    Hash do conteúdo (Palavra, Significado) de cada linha, por origem, na ordem do DataFrame.
+    A posição não entra no hash: uma linha que apenas mudou de lugar mantém o mesmo hash.
+    """
+    hashes = {}
+    for chave, (_, row) in zip(origens_da_planilha(df), df.iterrows()):
+        conteudo = json.dumps([str(row['Palavra']), str(row['Significado'])], ensure_ascii=False)
+        hashes[chave] = hashlib.sha256(conteudo.encode('utf-8')).hexdigest()
+    return hashes
+
+def _carregar_json(caminho, padrao):
+    if not os.path.exists(caminho):
+        return padrao
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def atualizar(arquivo_entrada=ARQUIVO_ENTRADA_BRUTO, saida_json=ARQUIVO_SAIDA_JSON, saida_csv=ARQUIVO_SAIDA_CSV,
+              arquivo_embeddings=ARQUIVO_EMBEDDINGS, arquivo_estado=ARQUIVO_ESTADO, backend="fp32"):
+    """
+    Reprocessa apenas as linhas adicionadas, alteradas ou removidas desde a última
+    execução e aplica o resultado no dataset expandido e nos embeddings existentes.
+    """
+    df = carregar_dados_brutos(arquivo_entrada)
+    if df is None: return None
+
+    hashes_atuais = hashes_da_planilha(df)
+    origens = origens_da_planilha(df)
+    estado = _carregar_json(arquivo_estado, None)
+    dataset = _carregar_json(saida_json, None)
+
+    # Sem estado ou sem dataset anterior não há como casar os itens antigos com as linhas:
+    # tudo é reconstruído (dataset e embeddings), em vez de aplicado como patch
+    reconstruir = estado is None or dataset is None
+    if reconstruir:
+        print("⚠️ Sem estado anterior: reconstruindo o dataset e os embeddings a partir de todas as linhas.")
+        estado = {"linhas": {}}
+        dataset = []
+
+    adicionadas, alteradas, removidas, movidas = detectar_mudancas(hashes_atuais, estado["linhas"])
+    inalteradas = len(hashes_atuais) - len(adicionadas) - len(alteradas) - len(movidas)
+    print(f"--- Linhas: {len(adicionadas)} adicionadas, {len(alteradas)} alteradas, {len(removidas)} removidas, "
+          f"{len(movidas)} movidas, {inalteradas} inalteradas ---")
+
+    # Linhas alteradas também perdem os itens antigos (a chave continua a mesma)
+    afetadas = set(adicionadas) | set(alteradas) | set(removidas)
+    if not afetadas and not movidas and not reconstruir:
+        print("✅ Nada a reprocessar.")
+        return {"adicionadas": 0, "alteradas": 0, "removidas": 0, "movidas": 0}
+
+    ordem = {chave: i for i, chave in enumerate(hashes_atuais)}
+    reprocessar = set(adicionadas) | set(alteradas)
+    chaves_df = list(hashes_atuais)
+    df_alterado = df[[chave in reprocessar for chave in chaves_df]]
+
+    # 1. Re-expansão e re-tokenização apenas das linhas novas/alteradas
+    novos_itens = []
+    if not df_alterado.empty:
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(MODELO_NOME)
+        novos_itens, _ = processar_augmentacao(df_alterado, tokenizer)
+
+    dataset = aplicar_patch(dataset, novos_itens, afetadas, ordem, movidas, origens, ARQUIVO_ENTRADA_BRUTO)
+    salvar_dataset(dataset, saida_json, saida_csv)
+    print(f"✅ Dataset atualizado: {len(dataset)} itens em {saida_json}")
+
+    # 2. Re-embedding apenas dos itens novos (se já existir um store de embeddings)
+    embeddings = _carregar_json(arquivo_embeddings, None)
+    if embeddings is not None:
+        if reconstruir:
+            embeddings = []
+        novos_vetores = []
+        if novos_itens:
+            from .extraction_script import MODELS_CONFIG, load_model_and_tokenizer, extrair_embeddings
+            tokenizer_yrl, model_yrl = load_model_and_tokenizer(MODELS_CONFIG['nheengatu'], backend)
+            tokenizer_pt, model_pt = load_model_and_tokenizer(MODELS_CONFIG['portugues'], backend)
+            novos_vetores = extrair_embeddings(novos_itens, tokenizer_yrl, model_yrl, tokenizer_pt, model_pt)
+
+        embeddings = aplicar_patch(embeddings, novos_vetores, afetadas, ordem, movidas, origens, ARQUIVO_ENTRADA_BRUTO)
+        with open(arquivo_embeddings, 'w', encoding='utf-8') as f:
+            json.dump(embeddings, f, ensure_ascii=False, indent=2)
+        print(f"✅ Embeddings atualizados: {len(embeddings)} pares em {arquivo_embeddings}")
+    else:
+        print(f"⚠️ '{arquivo_embeddings}' não encontrado: execute o extraction_script.py para gerar os embeddings.")
+
+    # 3. O estado só é gravado depois que tudo foi salvo
+    with open(arquivo_estado, 'w', encoding='utf-8') as f:
+        json.dump({"arquivo": arquivo_entrada, "linhas": hashes_atuais}, f, ensure_ascii=False, indent=2)
+
+    return {"adicionadas": len(adicionadas), "alteradas": len(alteradas), "removidas": len(removidas),
+            "movidas": len(movidas)}
+
+if __name__ == "__main__":
+    atualizar()
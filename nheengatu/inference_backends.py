@@ -0,0 +1,230 @@
+import os
+import time
+import json
+import types
+import numpy as np
+import torch
+
+# Backends de inferência disponíveis para CPU
+# fp32 : modelo PyTorch original (referência)
+# int8 : quantização dinâmica int8 das camadas Linear (torch.quantization)
+# bf16 : autocast bfloat16 (apenas se a CPU suportar instruções bf16)
+# onnx : grafo exportado e executado pelo ONNX Runtime
+BACKENDS = ["fp32", "int8", "bf16", "onnx"]
+
+PASTA_ONNX = "modelos_onnx"
+OUTPUT_REPORT = "relatorio_backends.csv"
+OUTPUT_COSSENOS = "relatorio_backends_cossenos.csv"   # um cosseno por texto e backend
+DATASET_FILE = "dataset_nheengatu_expandido.json"
+
+# Textos executados antes de cronometrar cada backend (descarta custos de inicialização)
+N_AQUECIMENTO = 8
+
+def bf16_suportado():
+    """Verifica se a CPU possui suporte nativo a bfloat16 (oneDNN)."""
+    verificador = getattr(torch.ops.mkldnn, "_is_mkldnn_bf16_supported", None)
+    if verificador is None:
+        return False
+    try:
+        return bool(verificador())
+    except Exception:
+        return False
+
+class Bf16AutocastModel(torch.nn.Module):
+    """
+    Executa o modelo sob autocast bfloat16 na CPU.
+    A saída é convertida de volta para float32 para manter o pooling estável.
+    """
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, *args, **kwargs):
+        with torch.autocast(device_type="cpu", dtype=torch.bfloat16):
+            outputs = self.model(*args, **kwargs)
+        return types.SimpleNamespace(last_hidden_state=outputs.last_hidden_state.float())
+
+class _LastHiddenStateWrapper(torch.nn.Module):
+    """Expõe apenas o last_hidden_state (necessário para exportar o grafo ONNX)."""
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        return self.model(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+
+class OnnxEncoder:
+    """
+    Encoder executado pelo ONNX Runtime com a mesma interface do modelo PyTorch:
+    model(input_ids, attention_mask=...) -> objeto com .last_hidden_state (tensor).
+    """
+    def __init__(self, onnx_path):
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise ImportError("O backend 'onnx' requer o pacote 'onnxruntime' (pip install onnxruntime).") from e
+
+        opcoes = ort.SessionOptions()
+        opcoes.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(onnx_path, opcoes, providers=["CPUExecutionProvider"])
+
+    def eval(self):
+        return self
+
+    def to(self, device):
+        return self
+
+    def __call__(self, input_ids=None, attention_mask=None, **kwargs):
+        if attention_mask is None:
+            attention_mask = torch.ones_like(input_ids)
+        feeds = {
+            "input_ids": input_ids.cpu().numpy().astype(np.int64),
+            "attention_mask": attention_mask.cpu().numpy().astype(np.int64),
+        }
+        last_hidden_state = self.session.run(["last_hidden_state"], feeds)[0]
+        return types.SimpleNamespace(last_hidden_state=torch.from_numpy(last_hidden_state))
+
+def caminho_onnx(model_name, revisao=None):
+    """
+    Caminho do arquivo .onnx em cache para um modelo do Hugging Face Hub.
+    A revisão (commit do Hub) entra no nome: um modelo atualizado gera outro arquivo.
+    """
+    nome = model_name.replace("/", "__")
+    if revisao:
+        nome += f"__{revisao[:12]}"
+    return os.path.join(PASTA_ONNX, nome + ".onnx")
+
+def exportar_onnx(model, tokenizer, model_name, reexportar=False):
+    """Exporta o modelo para ONNX (uma vez por revisão) e retorna o caminho do arquivo."""
+    revisao = getattr(getattr(model, "config", None), "_commit_hash", None)
+    destino = caminho_onnx(model_name, revisao)
+    if os.path.exists(destino) and not reexportar:
+        return destino
+
+    os.makedirs(PASTA_ONNX, exist_ok=True)
+    print(f"⏳ Exportando {model_name} para ONNX em '{destino}'...")
+
+    exemplo = tokenizer("nheengatu", return_tensors="pt")
+    torch.onnx.export(
+        _LastHiddenStateWrapper(model).eval(),
+        (exemplo["input_ids"], exemplo["attention_mask"]),
+        destino,
+        input_names=["input_ids", "attention_mask"],
+        output_names=["last_hidden_state"],
+        # Batch e comprimento de sequência variáveis
+        dynamic_axes={
+            "input_ids": {0: "batch", 1: "seq"},
+            "attention_mask": {0: "batch", 1: "seq"},
+            "last_hidden_state": {0: "batch", 1: "seq"},
+        },
+        opset_version=14,
+    )
+    return destino
+
+def aplicar_backend(model, tokenizer, model_name, backend, reexportar=False):
+    """
+    Converte um modelo fp32 (já em modo eval, na CPU) para o backend pedido.
+    reexportar=True ignora o .onnx em cache e exporta o grafo novamente.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend '{backend}' desconhecido. Opções: {BACKENDS}")
+
+    if backend == "fp32":
+        return model
+
+    if backend == "int8":
+        # Quantiza apenas as camadas Linear (pesos int8, ativações dinâmicas)
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    if backend == "bf16":
+        if not bf16_suportado():
+            raise RuntimeError("Esta CPU não suporta bfloat16 nativamente; use 'fp32' ou 'int8'.")
+        return Bf16AutocastModel(model).eval()
+
+    # backend == "onnx"
+    return OnnxEncoder(exportar_onnx(model, tokenizer, model_name, reexportar))
+
+def _cosseno_por_linha(a, b):
+    """Similaridade de cosseno entre as linhas correspondentes de duas matrizes."""
+    normas = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+    return np.sum(a * b, axis=1) / np.maximum(normas, 1e-12)
+
+def _extrair_todos(textos, tokenizer, model):
+    """
+    Extrai um vetor por texto e mede o tempo total (segundos), após um
+    aquecimento que não entra na medição.
+    """
+    from .extraction_script import get_word_embedding
+
+    for t in textos[:N_AQUECIMENTO]:
+        get_word_embedding(t, t, tokenizer, model)
+
+    inicio = time.perf_counter()
+    vetores = [get_word_embedding(t, t, tokenizer, model) for t in textos]
+    return np.vstack(vetores), time.perf_counter() - inicio
+
+def relatorio_paridade(backends=None, dataset_file=DATASET_FILE, output_report=OUTPUT_REPORT, limite=None,
+                       reexportar=False, output_cossenos=OUTPUT_COSSENOS):
+    """
+    Compara cada backend com o fp32 para Canarim e BERTimbau:
+    cosseno por vetor em relação ao fp32 (média/mínimo) e throughput (palavras/s).
+    Os cossenos de cada texto são salvos em output_cossenos.
+    """
+    import pandas as pd
+    from .extraction_script import MODELS_CONFIG, load_model_and_tokenizer
+
+    backends = backends or BACKENDS
+    if "bf16" in backends and not bf16_suportado():
+        print("⚠️ CPU sem suporte a bfloat16: backend 'bf16' ignorado.")
+        backends = [b for b in backends if b != "bf16"]
+
+    try:
+        with open(dataset_file, 'r', encoding='utf-8') as f:
+            dataset = json.load(f)
+    except FileNotFoundError:
+        print(f"❌ Arquivo '{dataset_file}' não encontrado. Execute o pipeline_v2_augment.py antes.")
+        return None
+
+    if limite:
+        dataset = dataset[:limite]
+
+    campos = {"nheengatu": "nheengatu_text", "portugues": "portuguese_text"}
+    linhas = []
+    cossenos_por_texto = []
+
+    for lingua, model_name in MODELS_CONFIG.items():
+        # Textos vazios viram vetores zerados em todos os backends (cosseno 0, falsa divergência)
+        textos = [item.get(campos[lingua]) for item in dataset if item.get(campos[lingua])]
+        tokenizer, model_fp32 = load_model_and_tokenizer(model_name)
+        referencia, tempo_ref = _extrair_todos(textos, tokenizer, model_fp32)
+
+        for backend in backends:
+            if backend == "fp32":
+                vetores, tempo = referencia, tempo_ref
+            else:
+                model = aplicar_backend(model_fp32, tokenizer, model_name, backend, reexportar)
+                vetores, tempo = _extrair_todos(textos, tokenizer, model)
+
+            cossenos = _cosseno_por_linha(referencia, vetores)
+            cossenos_por_texto.extend({"Modelo": model_name, "Backend": backend, "Texto": t, "Cosseno": float(c)}
+                                      for t, c in zip(textos, cossenos))
+            linhas.append({
+                "Modelo": model_name,
+                "Backend": backend,
+                "Cosseno_Medio": float(cossenos.mean()),
+                "Cosseno_Minimo": float(cossenos.min()),
+                "Palavras_por_s": len(textos) / tempo,
+                "Speedup": tempo_ref / tempo,
+            })
+            print(f"[{backend:<5}] {model_name:<40} cos_min={cossenos.min():.4f} "
+                  f"{len(textos)/tempo:8.1f} palavras/s ({tempo_ref/tempo:.2f}x)")
+
+    df = pd.DataFrame(linhas)
+    df.to_csv(output_report, index=False, encoding='utf-8-sig', sep=';', float_format='%.4f')
+    pd.DataFrame(cossenos_por_texto).to_csv(output_cossenos, index=False, encoding='utf-8-sig', sep=';',
+                                            float_format='%.6f')
+    print(f"\n📄 Relatório de paridade salvo em: {output_report} (cossenos por texto em {output_cossenos})")
+    return df
+
+if __name__ == "__main__":
+    relatorio_paridade()
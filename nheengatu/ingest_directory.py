@@ -0,0 +1,98 @@
+import os
+import glob
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+
+# Configuração dos caminhos (Paths)
+PASTA_ENTRADA = "planilhas_campo"
+ARQUIVO_SAIDA = "dataset_nheengatu_mesclado.xlsx"
+ARQUIVO_RELATORIO = "relatorio_ingestao.csv"
+COLUNAS_OBRIGATORIAS = ['Palavra', 'Significado']
+
+def encontrar_planilhas(pasta, ignorar=()):
+    """
+    Lista recursivamente as planilhas .xlsx (ignorando arquivos temporários '~$' do Excel
+    e os caminhos em `ignorar`, ex: o próprio dataset mesclado salvo dentro da pasta).
+    """
+    ignorados = {os.path.abspath(c) for c in ignorar}
+    caminhos = glob.glob(os.path.join(pasta, "**", "*.xlsx"), recursive=True)
+    return sorted(c for c in caminhos
+                  if not os.path.basename(c).startswith("~$") and os.path.abspath(c) not in ignorados)
+
+def processar_planilha(caminho):
+    """
+    Lê e valida uma planilha (executado em um processo separado).
+    Retorna (DataFrame com proveniência ou None, dicionário do relatório).
+    """
+    relatorio = {"Arquivo": caminho, "Status": "OK", "Linhas": 0, "Linhas_Vazias": 0, "Erro": ""}
+    try:
+        df = pd.read_excel(caminho, engine='openpyxl')
+    except Exception as e:
+        relatorio.update(Status="ERRO", Erro=f"Falha ao ler a planilha: {e}")
+        return None, relatorio
+
+    # Normalização dos cabeçalhos (mesma regra de carregar_dados_brutos)
+    df.columns = [str(c).strip().title() for c in df.columns]
+
+    faltantes = [c for c in COLUNAS_OBRIGATORIAS if c not in df.columns]
+    if faltantes:
+        relatorio.update(Status="ERRO", Erro=f"Colunas ausentes: {faltantes}. Encontradas: {list(df.columns)}")
+        return None, relatorio
+
+    # Linha no Excel (Header=1, Index=0), calculada antes de descartar linhas
+    df = df[COLUNAS_OBRIGATORIAS].copy()
+    df['Linha'] = df.index + 2
+    df['Arquivo'] = caminho
+
+    # Linhas sem palavra ou sem significado não podem ser expandidas
+    vazias = df['Palavra'].isna() | df['Significado'].isna()
+    vazias |= df['Palavra'].astype(str).str.strip().eq('') | df['Significado'].astype(str).str.strip().eq('')
+    df = df[~vazias]
+
+    relatorio["Linhas"] = len(df)
+    relatorio["Linhas_Vazias"] = int(vazias.sum())
+    if relatorio["Linhas_Vazias"]:
+        relatorio["Status"] = "ALERTA"
+    if df.empty:
+        relatorio.update(Status="ERRO", Erro="Nenhuma linha válida.")
+        return None, relatorio
+
+    return df, relatorio
+
+def ingerir_pasta(pasta=PASTA_ENTRADA, arquivo_saida=ARQUIVO_SAIDA, arquivo_relatorio=ARQUIVO_RELATORIO, max_workers=None):
+    """
+    Processa todas as planilhas da pasta em paralelo e mescla o resultado
+    em um único dataset, com proveniência (Arquivo, Linha) por registro.
+    """
+    # A saída de uma execução anterior não pode voltar como entrada
+    caminhos = encontrar_planilhas(pasta, ignorar=[arquivo_saida])
+    if not caminhos:
+        print(f"[ERRO] Nenhuma planilha .xlsx encontrada em '{pasta}'.")
+        return None
+
+    print(f"[INFO] {len(caminhos)} planilhas encontradas em '{pasta}'.")
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        resultados = list(executor.map(processar_planilha, caminhos))
+
+    frames = [df for df, _ in resultados if df is not None]
+    relatorios = pd.DataFrame([rel for _, rel in resultados])
+
+    for rel in relatorios.itertuples():
+        print(f"[{rel.Status}] {rel.Arquivo}: {rel.Linhas} linhas válidas {rel.Erro}")
+
+    relatorios.to_csv(arquivo_relatorio, index=False, encoding='utf-8-sig', sep=';')
+    print(f"[INFO] Relatório por arquivo salvo em '{arquivo_relatorio}'.")
+
+    if not frames:
+        print("[ERRO] Nenhuma planilha válida para mesclar.")
+        return None
+
+    mesclado = pd.concat(frames, ignore_index=True)
+    mesclado.to_excel(arquivo_saida, index=False, engine='openpyxl')
+
+    print(f"[INFO] Dataset mesclado com {len(mesclado)} registros de {len(frames)} planilhas salvo em '{arquivo_saida}'.")
+    return mesclado
+
+if __name__ == "__main__":
+    ingerir_pasta()
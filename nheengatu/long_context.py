@@ -0,0 +1,160 @@
+import json
+import numpy as np
+import torch
+from .extraction_script import device, get_isolated_embedding
+from .normalizer import normalize_unicode
+from .target_search import localizar_ocorrencias, indexar_alvos, localizar_alvos
+
+# Configuração de Entrada/Saída
+CORPUS_FILE = "corpus_narrativas.json"   # lista de {"id": ..., "texto": ...}
+DATASET_FILE = "dataset_nheengatu_expandido.json"
+OUTPUT_FILE = "embeddings_contexto_longo.json"
+
+# Sobreposição (em tokens) entre janelas consecutivas
+STRIDE = 128
+# Janelas processadas por forward
+BATCH_JANELAS = 8
+# Como combinar as janelas que contêm um alvo (ver embeddings_por_spans)
+ESTRATEGIAS = ("centro", "media")
+
+def limite_tokens(tokenizer, model):
+    """Maior sequência aceita pelo modelo (512 nos BERTs do projeto)."""
+    limite_modelo = getattr(getattr(model, "config", None), "max_position_embeddings", 512)
+    return min(tokenizer.model_max_length, limite_modelo)
+
+def _indices_no_span(offsets, inicio, fim):
+    """Tokens da janela contidos no span (mesma regra de get_word_embedding)."""
+    return [idx for idx, (s, e) in enumerate(offsets) if s != e and s >= inicio and e <= fim]
+
+def _centralidade(offsets, indices):
+    """Contexto disponível do lado mais curto do alvo (maior = mais centralizado)."""
+    conteudo = [idx for idx, (s, e) in enumerate(offsets) if s != e]
+    return min(indices[0] - conteudo[0], conteudo[-1] - indices[-1])
+
+def embeddings_por_spans(texto, spans, tokenizer, model, stride=STRIDE, estrategia="centro",
+                         max_length=None, batch_janelas=BATCH_JANELAS):
+    """
+    Embedding de cada span de um documento de qualquer tamanho.
+
+    O documento é dividido em janelas sobrepostas (stride/overflow do tokenizer),
+    mas só passam pelo modelo as janelas escolhidas para algum span:
+    - estrategia="centro": a janela em que o alvo está mais centralizado;
+    - estrategia="media": média entre todas as janelas que contêm o alvo inteiro.
+    Retorna uma lista com um vetor (ou None, se o span não tiver tokens) por span.
+    """
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estratégia '{estrategia}' desconhecida. Opções: {ESTRATEGIAS}")
+    max_length = max_length or limite_tokens(tokenizer, model)
+    janelas = tokenizer(texto, max_length=max_length, stride=stride, truncation=True,
+                        return_overflowing_tokens=True, return_offsets_mapping=True)
+
+    # 1. Para cada span, escolhe as janelas (e os tokens dentro delas)
+    escolhas = []
+    for inicio, fim in spans:
+        candidatas = []
+        for j, offsets in enumerate(janelas["offset_mapping"]):
+            indices = _indices_no_span(offsets, inicio, fim)
+            if indices:
+                candidatas.append((j, indices))
+        if not candidatas:
+            escolhas.append([])
+            continue
+
+        # Só contam as janelas que contêm o alvo inteiro (o maior número de tokens)
+        completo = max(len(ind) for _, ind in candidatas)
+        candidatas = [(j, ind) for j, ind in candidatas if len(ind) == completo]
+        if estrategia == "centro":
+            candidatas = [max(candidatas, key=lambda c: _centralidade(janelas["offset_mapping"][c[0]], c[1]))]
+        escolhas.append(candidatas)
+
+    # 2. Executa o modelo apenas nas janelas necessárias
+    necessarias = sorted({j for candidatas in escolhas for j, _ in candidatas})
+    estados = {}
+    pad_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else 0
+    for b in range(0, len(necessarias), batch_janelas):
+        lote = necessarias[b:b + batch_janelas]
+        max_len = max(len(janelas["input_ids"][j]) for j in lote)
+        input_ids = torch.full((len(lote), max_len), pad_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(lote), max_len), dtype=torch.long)
+        for linha, j in enumerate(lote):
+            ids = janelas["input_ids"][j]
+            input_ids[linha, :len(ids)] = torch.tensor(ids)
+            attention_mask[linha, :len(ids)] = 1
+
+        with torch.no_grad():
+            outputs = model(input_ids.to(device), attention_mask=attention_mask.to(device))
+        for linha, j in enumerate(lote):
+            estados[j] = outputs.last_hidden_state[linha]
+
+    # 3. Mean pooling dos tokens do alvo (e média entre janelas, se houver mais de uma)
+    vetores = []
+    for candidatas in escolhas:
+        if not candidatas:
+            vetores.append(None)
+            continue
+        por_janela = [estados[j].index_select(0, torch.tensor(ind, device=estados[j].device)).mean(dim=0)
+                      for j, ind in candidatas]
+        vetores.append(torch.stack(por_janela).mean(dim=0).cpu().numpy())
+    return vetores
+
+def get_long_context_embeddings(text, target_word, tokenizer, model, **kwargs):
+    """Um embedding por ocorrência de 'target_word' em um texto longo."""
+    spans = localizar_ocorrencias(text, target_word)
+    return [v for v in embeddings_por_spans(text, spans, tokenizer, model, **kwargs) if v is not None]
+
+def get_long_context_embedding(text, target_word, tokenizer, model, **kwargs):
+    """Média das ocorrências; se a palavra não aparecer, usa o embedding isolado."""
+    vetores = get_long_context_embeddings(text, target_word, tokenizer, model, **kwargs)
+    if not vetores:
+        return get_isolated_embedding(target_word, tokenizer, model)
+    return np.mean(vetores, axis=0)
+
+def main(corpus_file=CORPUS_FILE, dataset_file=DATASET_FILE, output_file=OUTPUT_FILE,
+         estrategia="centro", backend="fp32"):
+    from .extraction_script import MODELS_CONFIG, load_model_and_tokenizer
+
+    # Falha antes de carregar o modelo
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estratégia '{estrategia}' desconhecida. Opções: {ESTRATEGIAS}")
+
+    try:
+        with open(corpus_file, 'r', encoding='utf-8') as f:
+            corpus = json.load(f)
+        with open(dataset_file, 'r', encoding='utf-8') as f:
+            alvos = sorted({item['nheengatu_text'] for item in json.load(f) if item.get('nheengatu_text')})
+    except FileNotFoundError as e:
+        print(f"❌ Arquivo não encontrado: {e.filename}")
+        return
+
+    tokenizer, model = load_model_and_tokenizer(MODELS_CONFIG['nheengatu'], backend)
+    results = []
+
+    indice = indexar_alvos(alvos)
+
+    print(f"🚀 Buscando {len(alvos)} palavras em {len(corpus)} documentos...")
+    for doc in corpus:
+        # Transcrições podem vir em NFD; os alvos do dataset estão em NFC
+        texto = normalize_unicode(doc.get('texto', ''))
+        # Busca barata em texto: documentos sem nenhum alvo nem chegam a ser tokenizados
+        ocorrencias = localizar_alvos(texto, indice)
+        if not ocorrencias:
+            continue
+
+        vetores = embeddings_por_spans(texto, [span for _, span in ocorrencias], tokenizer, model, estrategia=estrategia)
+        for (alvo, (inicio, fim)), vetor in zip(ocorrencias, vetores):
+            if vetor is None: continue
+            results.append({
+                "documento": doc.get('id'),
+                "nheengatu_text": alvo,
+                "inicio": inicio,
+                "fim": fim,
+                "vetor_yrl": vetor.tolist(),
+            })
+        print(f"Documento {doc.get('id')}: {len(ocorrencias)} ocorrências")
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"✅ Sucesso! {len(results)} embeddings de ocorrências salvos em {output_file}.")
+
+if __name__ == "__main__":
+    main()
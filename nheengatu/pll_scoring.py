@@ -0,0 +1,150 @@
+import json
+from collections import defaultdict
+import torch
+from transformers import AutoTokenizer, AutoModelForMaskedLM
+from .extraction_script import device
+
+# Configuração
+MODELO_NOME = "dominguesm/canarim-bert-nheengatu"
+INPUT_FILE = "dataset_nheengatu_expandido.json"
+OUTPUT_FILE = "ranking_variantes_pll.json"
+
+# Orçamento de tokens por forward (batch x comprimento, já com padding)
+MAX_TOKENS_BATCH = 8192
+
+def carregar_modelo_mlm(model_name=MODELO_NOME):
+    """Carrega o Canarim com a cabeça de Masked-LM."""
+    print(f"⏳ Carregando Modelo (MLM): {model_name}")
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForMaskedLM.from_pretrained(model_name)
+    model.to(device)
+    model.eval()
+    print(f"✅ Modelo {model_name} carregado!")
+    return tokenizer, model
+
+def gerar_copias_mascaradas(textos, tokenizer):
+    """
+    Para cada texto, cria uma cópia por subword com aquele token trocado por [MASK].
+    Retorna lista de (indice_texto, posicao, input_ids_mascarados, id_original)
+    e o número de subwords pontuadas por texto.
+    """
+    copias = []
+    n_tokens = []
+    for t_idx, texto in enumerate(textos):
+        ids = tokenizer(texto, add_special_tokens=True, truncation=True)["input_ids"]
+        especiais = tokenizer.get_special_tokens_mask(ids, already_has_special_tokens=True)
+        posicoes = [p for p, esp in enumerate(especiais) if not esp]
+        n_tokens.append(len(posicoes))
+        for pos in posicoes:
+            mascarado = list(ids)
+            mascarado[pos] = tokenizer.mask_token_id
+            copias.append((t_idx, pos, mascarado, ids[pos]))
+    return copias, n_tokens
+
+def empacotar_batches(copias, max_tokens=MAX_TOKENS_BATCH):
+    """
+    Ordena as cópias por comprimento (menos padding) e as agrupa em batches
+    cujo tamanho x maior comprimento não passa de max_tokens.
+    """
+    ordenadas = sorted(copias, key=lambda c: len(c[2]))
+    batch = []
+    for copia in ordenadas:
+        # Como a lista está ordenada, a cópia atual é a mais longa do batch
+        if batch and (len(batch) + 1) * len(copia[2]) > max_tokens:
+            yield batch
+            batch = []
+        batch.append(copia)
+    if batch:
+        yield batch
+
+def pontuar_pll(textos, tokenizer, model, max_tokens=MAX_TOKENS_BATCH):
+    """
+    Pseudo-log-verossimilhança (PLL) de cada texto: soma de log P(token | resto)
+    com cada subword mascarada uma vez. Todas as cópias mascaradas de todos os
+    textos são executadas juntas, em poucos forwards grandes.
+    """
+    copias, n_tokens = gerar_copias_mascaradas(textos, tokenizer)
+    soma_logprob = [0.0] * len(textos)
+    pad_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else 0
+
+    with torch.no_grad():
+        for batch in empacotar_batches(copias, max_tokens):
+            max_len = len(batch[-1][2])
+            input_ids = torch.full((len(batch), max_len), pad_id, dtype=torch.long)
+            attention_mask = torch.zeros((len(batch), max_len), dtype=torch.long)
+            for linha, (_, _, ids, _) in enumerate(batch):
+                input_ids[linha, :len(ids)] = torch.tensor(ids)
+                attention_mask[linha, :len(ids)] = 1
+
+            logits = model(input_ids=input_ids.to(device), attention_mask=attention_mask.to(device)).logits
+
+            # log_softmax apenas na posição mascarada de cada linha
+            linhas = torch.arange(len(batch), device=device)
+            posicoes = torch.tensor([c[1] for c in batch], device=device)
+            alvos = torch.tensor([c[3] for c in batch], device=device)
+            logprobs = torch.log_softmax(logits[linhas, posicoes].float(), dim=-1)
+            escolhidos = logprobs[linhas, alvos].cpu().tolist()
+
+            for (t_idx, _, _, _), lp in zip(batch, escolhidos):
+                soma_logprob[t_idx] += lp
+
+    resultados = []
+    for texto, pll, n in zip(textos, soma_logprob, n_tokens):
+        resultados.append({
+            "texto": texto,
+            "pll": pll,
+            "n_subwords": n,
+            # PLL por subword: permite comparar grafias com tamanhos diferentes
+            "pll_medio": pll / n if n else None,
+        })
+    return resultados
+
+def ranquear_variantes(dataset, tokenizer, model, max_tokens=MAX_TOKENS_BATCH):
+    """
+    Agrupa as variantes geradas pela expansão (mesma linha de origem) e as ordena
+    pela PLL média: a primeira é a grafia que o Canarim melhor "conhece".
+    """
+    grupos = defaultdict(list)
+    for item in dataset:
+        meta = item.get('metadata', {})
+        chave = (meta.get('source_file', ''), meta.get('source_line'))
+        forma = item.get('nheengatu_text')
+        if forma and forma not in grupos[chave]:
+            grupos[chave].append(forma)
+
+    # Cada forma distinta é pontuada uma única vez
+    formas = sorted({f for membros in grupos.values() for f in membros})
+    print(f"--- Calculando PLL de {len(formas)} formas ({len(grupos)} linhas de origem) ---")
+    pontuacoes = {r["texto"]: r for r in pontuar_pll(formas, tokenizer, model, max_tokens)}
+
+    ranking = []
+    for (arquivo, linha), membros in sorted(grupos.items(), key=lambda g: (str(g[0][0]), g[0][1] or 0)):
+        variantes = sorted((pontuacoes[f] for f in membros),
+                           key=lambda r: r["pll_medio"] if r["pll_medio"] is not None else float("-inf"),
+                           reverse=True)
+        ranking.append({"source_file": arquivo, "source_line": linha, "variantes": variantes})
+    return ranking
+
+def main(input_file=INPUT_FILE, output_file=OUTPUT_FILE, max_tokens=MAX_TOKENS_BATCH):
+    try:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            dataset = json.load(f)
+    except FileNotFoundError:
+        print(f"❌ Arquivo '{input_file}' não encontrado. Execute o pipeline_v2_augment.py antes.")
+        return
+
+    tokenizer, model = carregar_modelo_mlm()
+    ranking = ranquear_variantes(dataset, tokenizer, model, max_tokens)
+
+    for grupo in ranking:
+        if len(grupo["variantes"]) > 1:
+            formas = " > ".join(f"{v['texto']} ({v['pll_medio'] or 0:.2f})" for v in grupo["variantes"])
+            # Datasets anteriores à proveniência (Arquivo/Linha) não têm source_line
+            print(f"Linha {str(grupo['source_line']):>4}: {formas}")
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(ranking, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ Ranking de variantes salvo em: {output_file}")
+
+if __name__ == "__main__":
+    main()
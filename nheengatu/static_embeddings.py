@@ -0,0 +1,109 @@
+import json
+import numpy as np
+from .normalizer import clean_text_nheengatu, normalize_unicode
+
+# Configuração de Entrada/Saída
+INPUT_FILES = ["embeddings_extraidos.json"]
+PREFIXO_SAIDA = "tabela_estatica"
+
+# Campos de cada lado do par no JSON de embeddings
+LADOS = {
+    "yrl": ("nheengatu_text", "vetor_yrl"),
+    "pt": ("portuguese_text", "vetor_pt"),
+}
+
+def chave_palavra(palavra, lado="yrl"):
+    """
+    Chave do tipo de palavra na tabela. O BERTimbau é cased: no lado 'pt' só há
+    NFC + strip ('Sol' e 'sol' são tipos diferentes); o Nheengatu usa a normalização completa.
+    """
+    if lado == "pt":
+        return normalize_unicode(palavra).strip()
+    return clean_text_nheengatu(palavra)
+
+def construir_tabela(input_files=INPUT_FILES, lado="yrl", prefixo_saida=PREFIXO_SAIDA):
+    """
+    Agrega os embeddings contextuais por tipo de palavra normalizado (média das
+    ocorrências, com contagem) e salva uma matriz .npy + índice palavra -> linha.
+    Aceita qualquer JSON com o campo de texto e o vetor (ex: embeddings_extraidos.json,
+    embeddings_contexto_longo.json).
+    """
+    campo_texto, campo_vetor = LADOS[lado]
+    linhas = {}
+    somas = []
+    contagens = []
+
+    for caminho in input_files:
+        try:
+            with open(caminho, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            print(f"⚠️ Arquivo '{caminho}' não encontrado, ignorado.")
+            continue
+
+        for item in data:
+            if campo_vetor not in item or not item.get(campo_texto):
+                continue
+            palavra = chave_palavra(item[campo_texto], lado)
+            if palavra not in linhas:
+                linhas[palavra] = len(somas)
+                somas.append(np.zeros(len(item[campo_vetor]), dtype=np.float64))
+                contagens.append(0)
+            somas[linhas[palavra]] += item[campo_vetor]
+            contagens[linhas[palavra]] += 1
+
+    if not somas:
+        print("❌ Nenhum embedding encontrado para construir a tabela.")
+        return None
+
+    matriz = (np.vstack(somas) / np.asarray(contagens)[:, None]).astype(np.float32)
+    np.save(f"{prefixo_saida}_{lado}.npy", matriz)
+    with open(f"{prefixo_saida}_{lado}.json", 'w', encoding='utf-8') as f:
+        json.dump({"lado": lado, "dim": matriz.shape[1], "palavras": list(linhas), "contagens": contagens},
+                  f, ensure_ascii=False, indent=2)
+
+    print(f"✅ Tabela '{lado}' com {len(linhas)} tipos ({sum(contagens)} ocorrências) salva em "
+          f"{prefixo_saida}_{lado}.npy / .json")
+    return TabelaEstatica(matriz, list(linhas), contagens, lado)
+
+class TabelaEstatica:
+    """
+    Tabela de embeddings estáticos por tipo de palavra: a busca é um índice de
+    array. Palavras ausentes só passam pelo modelo se ele for fornecido.
+    """
+    def __init__(self, matriz, palavras, contagens, lado="yrl"):
+        self.matriz = matriz
+        self.lado = lado
+        self.palavras = palavras
+        self.contagens = contagens
+        self.indice = {p: i for i, p in enumerate(palavras)}
+
+    @classmethod
+    def carregar(cls, lado="yrl", prefixo=PREFIXO_SAIDA, mmap=True):
+        with open(f"{prefixo}_{lado}.json", 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        matriz = np.load(f"{prefixo}_{lado}.npy", mmap_mode='r' if mmap else None)
+        return cls(matriz, meta["palavras"], meta["contagens"], meta.get("lado", lado))
+
+    def __len__(self):
+        return len(self.palavras)
+
+    def __contains__(self, palavra):
+        return chave_palavra(palavra, self.lado) in self.indice
+
+    def vetor(self, palavra):
+        """Vetor médio do tipo (ou None se a palavra nunca foi vista)."""
+        linha = self.indice.get(chave_palavra(palavra, self.lado))
+        return None if linha is None else np.asarray(self.matriz[linha])
+
+    def obter(self, palavra, tokenizer=None, model=None):
+        """Busca na tabela; para palavras não vistas, recorre a get_isolated_embedding."""
+        vetor = self.vetor(palavra)
+        if vetor is None and model is not None:
+            from .extraction_script import get_isolated_embedding
+            vetor = get_isolated_embedding(palavra, tokenizer, model)
+        return vetor
+
+if __name__ == "__main__":
+    for lado in LADOS:
+        construir_tabela(INPUT_FILES, lado)
@@ -0,0 +1,44 @@
+"""
+Busca das palavras-alvo (palavra inteira, sem diferenciar caixa) nos textos do
+corpus, usada por long_context.py. Sem torch/transformers.
+"""
+import re
+from .normalizer import normalize_unicode
+
+def localizar_ocorrencias(texto, palavra):
+    """Spans (início, fim) de todas as ocorrências da palavra inteira no texto (sem diferenciar caixa)."""
+    padrao = r"(?<!\w)" + re.escape(palavra) + r"(?!\w)"
+    return [(m.start(), m.end()) for m in re.finditer(padrao, texto, flags=re.IGNORECASE)]
+
+PADRAO_PALAVRA = re.compile(r"\w+")
+
+def indexar_alvos(alvos):
+    """
+    Índice primeira palavra -> alvos que começam por ela (em minúsculas), para que
+    cada documento seja varrido uma única vez, e não uma vez por alvo.
+    """
+    indice = {}
+    for alvo in alvos:
+        alvo = normalize_unicode(alvo).lower()
+        primeira = PADRAO_PALAVRA.match(alvo)
+        # Alvos que não começam por letra/dígito (raros) ficam com um padrão pré-compilado
+        chave = primeira.group() if primeira else None
+        indice.setdefault(chave, []).append(alvo)
+    indice[None] = [(alvo, re.compile(r"(?<!\w)" + re.escape(alvo) + r"(?!\w)", flags=re.IGNORECASE))
+                    for alvo in indice.get(None, [])]
+    return indice
+
+def localizar_alvos(texto, indice):
+    """
+    Ocorrências (alvo, (início, fim)) de todos os alvos indexados no texto, com a
+    mesma regra de palavra inteira de localizar_ocorrencias.
+    """
+    ocorrencias = []
+    for m in PADRAO_PALAVRA.finditer(texto):
+        for alvo in indice.get(m.group().lower(), ()):
+            fim = m.start() + len(alvo)
+            if texto[m.start():fim].lower() == alvo and not PADRAO_PALAVRA.match(texto, fim, fim + 1):
+                ocorrencias.append((alvo, (m.start(), fim)))
+    for alvo, padrao in indice[None]:
+        ocorrencias.extend((alvo, (m.start(), m.end())) for m in padrao.finditer(texto))
+    return ocorrencias
@@ -0,0 +1,241 @@
+import os
+import json
+import numpy as np
+import torch
+import torch.nn.functional as F
+from torch.utils.data import Dataset, DataLoader
+
+# Configuração de Entrada/Saída
+INPUT_FILE = "embeddings_extraidos.json"
+CACHE_DIR = "cache_embeddings"
+OUTPUT_PROJECTION = "projecao_alinhamento.pt"
+
+# Hiperparâmetros padrão
+CONFIG_TREINO = {
+    "arquitetura": "linear",   # 'linear' ou 'mlp'
+    "dim_oculta": 512,         # usado apenas pela MLP
+    "batch_size": 32,
+    "epocas": 200,
+    "lr": 1e-3,
+    "temperatura": 0.05,
+    "paciencia": 15,           # épocas sem melhora no MRR de validação
+    "frac_validacao": 0.2,
+    "seed": 42,
+}
+
+def _origem_cache(input_file):
+    """Identifica o JSON de embeddings que gerou o cache (caminho, mtime e tamanho)."""
+    info = os.stat(input_file)
+    return {"arquivo": os.path.abspath(input_file), "mtime": info.st_mtime, "tamanho": info.st_size}
+
+def construir_cache(input_file=INPUT_FILE, cache_dir=CACHE_DIR):
+    """
+    Converte os embeddings congelados (extraídos uma única vez por extraction_script.py)
+    em matrizes .npy float32, que podem ser lidas via memory-map em todo treino.
+    """
+    caminho_yrl = os.path.join(cache_dir, "vetores_yrl.npy")
+    caminho_pt = os.path.join(cache_dir, "vetores_pt.npy")
+    caminho_meta = os.path.join(cache_dir, "metadados.json")
+
+    # O cache só é reaproveitado se veio deste mesmo arquivo, sem modificações
+    origem = _origem_cache(input_file)
+    if os.path.exists(caminho_meta):
+        with open(caminho_meta, 'r', encoding='utf-8') as f:
+            anterior = json.load(f)
+        if isinstance(anterior, dict) and anterior.get("origem") == origem:
+            print(f"✅ Cache de embeddings reaproveitado de '{cache_dir}'.")
+            return cache_dir
+        print(f"⚠️ Cache em '{cache_dir}' gerado a partir de outro arquivo (ou versão): refazendo.")
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    np.save(caminho_yrl, np.asarray([item['vetor_yrl'] for item in data], dtype=np.float32))
+    np.save(caminho_pt, np.asarray([item['vetor_pt'] for item in data], dtype=np.float32))
+
+    metadados = {
+        "origem": origem,
+        "itens": [{"nheengatu_text": item.get('nheengatu_text'),
+                   "portuguese_text": item.get('portuguese_text')} for item in data],
+    }
+    with open(caminho_meta, 'w', encoding='utf-8') as f:
+        json.dump(metadados, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ Cache com {len(data)} pares salvo em '{cache_dir}'.")
+    return cache_dir
+
+class ParesMemmap(Dataset):
+    """Pares (vetor_yrl, vetor_pt) lidos sob demanda das matrizes em memory-map."""
+    def __init__(self, cache_dir, indices):
+        self.yrl = np.load(os.path.join(cache_dir, "vetores_yrl.npy"), mmap_mode='r')
+        self.pt = np.load(os.path.join(cache_dir, "vetores_pt.npy"), mmap_mode='r')
+        self.indices = np.asarray(indices)
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, i):
+        idx = self.indices[i]
+        return torch.from_numpy(np.array(self.yrl[idx])), torch.from_numpy(np.array(self.pt[idx]))
+
+class ProjecaoAlinhamento(torch.nn.Module):
+    """Projeta o espaço do Canarim no espaço do BERTimbau (linear ou MLP pequena)."""
+    def __init__(self, dim_entrada, dim_saida, arquitetura="linear", dim_oculta=512):
+        super().__init__()
+        if arquitetura == "linear":
+            self.rede = torch.nn.Linear(dim_entrada, dim_saida, bias=False)
+        elif arquitetura == "mlp":
+            self.rede = torch.nn.Sequential(
+                torch.nn.Linear(dim_entrada, dim_oculta),
+                torch.nn.GELU(),
+                torch.nn.Linear(dim_oculta, dim_saida),
+            )
+        else:
+            raise ValueError(f"Arquitetura '{arquitetura}' desconhecida. Use 'linear' ou 'mlp'.")
+
+    def forward(self, x):
+        return self.rede(x)
+
+def _mesmo_alvo(vec_pt):
+    """
+    Matriz booleana [i, j] = True quando os pares i e j têm o mesmo vetor em
+    português (ex: Cuára -> sol e Kuara -> sol). Inclui a diagonal.
+    """
+    return (vec_pt.unsqueeze(1) == vec_pt.unsqueeze(0)).all(dim=-1)
+
+def perda_contrastiva(proj_yrl, vec_pt, temperatura):
+    """
+    InfoNCE simétrica com negativos in-batch: o par correto de cada palavra
+    está na diagonal da matriz de similaridades do batch. Candidatos com o
+    mesmo vetor alvo do positivo não são tratados como negativos.
+    """
+    a = F.normalize(proj_yrl, dim=-1)
+    b = F.normalize(vec_pt, dim=-1)
+    logits = a @ b.T / temperatura
+    falsos_negativos = _mesmo_alvo(vec_pt)
+    falsos_negativos.fill_diagonal_(False)
+    logits = logits.masked_fill(falsos_negativos, float("-inf"))
+    alvos = torch.arange(logits.size(0))
+    return (F.cross_entropy(logits, alvos) + F.cross_entropy(logits.T, alvos)) / 2
+
+def metricas_recuperacao(proj_yrl, vec_pt):
+    """
+    Recall@1, Recall@5 e MRR da busca Nheengatu -> Português entre os candidatos dados.
+    Coerente com perda_contrastiva: candidatos com o mesmo vetor alvo não competem
+    com o par correto, e empates com alvos diferentes contam contra ele.
+    """
+    sims = F.normalize(proj_yrl, dim=-1) @ F.normalize(vec_pt, dim=-1).T
+    corretos = sims.diagonal().unsqueeze(1)
+    # Posição (1 = primeiro) do par correto no ranking de cada linha
+    ranks = ((sims >= corretos) & ~_mesmo_alvo(vec_pt)).sum(dim=1) + 1
+    return {
+        "recall@1": (ranks <= 1).float().mean().item(),
+        "recall@5": (ranks <= 5).float().mean().item(),
+        "mrr": (1.0 / ranks.float()).mean().item(),
+    }
+
+def _avaliar(modelo, cache_dir, indices):
+    """Métricas de recuperação sobre um subconjunto do cache."""
+    yrl = np.load(os.path.join(cache_dir, "vetores_yrl.npy"), mmap_mode='r')
+    pt = np.load(os.path.join(cache_dir, "vetores_pt.npy"), mmap_mode='r')
+    modelo.eval()
+    with torch.no_grad():
+        proj = modelo(torch.from_numpy(np.asarray(yrl[indices])))
+    modelo.train()
+    return metricas_recuperacao(proj, torch.from_numpy(np.asarray(pt[indices])))
+
+def treinar(cache_dir=CACHE_DIR, output_projection=OUTPUT_PROJECTION, **overrides):
+    """
+    Treina a projeção sobre os embeddings em cache (os BERTs não rodam no loop),
+    com early stopping no MRR de validação, e exporta a melhor projeção.
+    """
+    config = {**CONFIG_TREINO, **overrides}
+    torch.manual_seed(config["seed"])
+
+    yrl = np.load(os.path.join(cache_dir, "vetores_yrl.npy"), mmap_mode='r')
+    pt = np.load(os.path.join(cache_dir, "vetores_pt.npy"), mmap_mode='r')
+    dim_yrl = yrl.shape[1]
+    dim_pt = pt.shape[1]
+
+    # Divisão treino/validação reprodutível por palavra Nheengatu (como em distill_student):
+    # todas as linhas de uma mesma palavra ficam do mesmo lado
+    with open(os.path.join(cache_dir, "metadados.json"), 'r', encoding='utf-8') as f:
+        grupos = [item.get('nheengatu_text') for item in json.load(f)["itens"]]
+    palavras = sorted(set(grupos), key=str)
+    rng = np.random.default_rng(config["seed"])
+    permutacao = rng.permutation(len(palavras))
+    n_val = max(1, int(len(palavras) * config["frac_validacao"]))
+    palavras_val = {palavras[i] for i in permutacao[:n_val]}
+    idx_val = np.array([i for i, g in enumerate(grupos) if g in palavras_val], dtype=np.int64)
+    idx_treino = np.array([i for i, g in enumerate(grupos) if g not in palavras_val], dtype=np.int64)
+
+    loader = DataLoader(ParesMemmap(cache_dir, idx_treino), batch_size=config["batch_size"],
+                        shuffle=True, drop_last=len(idx_treino) > config["batch_size"])
+
+    modelo = ProjecaoAlinhamento(dim_yrl, dim_pt, config["arquitetura"], config["dim_oculta"])
+    otimizador = torch.optim.AdamW(modelo.parameters(), lr=config["lr"])
+
+    linha_base = _avaliar(torch.nn.Identity(), cache_dir, idx_val) if dim_yrl == dim_pt else None
+    if linha_base:
+        print(f"Sem alinhamento (validação): R@1={linha_base['recall@1']:.3f} MRR={linha_base['mrr']:.3f}")
+
+    melhor = {"mrr": -1.0}
+    melhor_estado = None
+    epocas_sem_melhora = 0
+
+    print(f"🚀 Treinando projeção '{config['arquitetura']}' em {len(idx_treino)} pares ({len(idx_val)} para validação)...")
+    for epoca in range(1, config["epocas"] + 1):
+        perda_total = 0.0
+        for vec_yrl, vec_pt in loader:
+            perda = perda_contrastiva(modelo(vec_yrl), vec_pt, config["temperatura"])
+            otimizador.zero_grad()
+            perda.backward()
+            otimizador.step()
+            perda_total += perda.item()
+
+        metricas = _avaliar(modelo, cache_dir, idx_val)
+        if metricas["mrr"] > melhor["mrr"]:
+            melhor = {**metricas, "epoca": epoca}
+            melhor_estado = {k: v.clone() for k, v in modelo.state_dict().items()}
+            epocas_sem_melhora = 0
+        else:
+            epocas_sem_melhora += 1
+
+        if epoca % 10 == 0:
+            print(f"Época {epoca:>3} | perda={perda_total/max(1, len(loader)):.4f} | "
+                  f"R@1={metricas['recall@1']:.3f} R@5={metricas['recall@5']:.3f} MRR={metricas['mrr']:.3f}")
+
+        if epocas_sem_melhora >= config["paciencia"]:
+            print(f"⏹️ Early stopping na época {epoca} (melhor: época {melhor['epoca']}).")
+            break
+
+    # Exporta a melhor projeção com a configuração necessária para recriá-la
+    torch.save({
+        "state_dict": melhor_estado,
+        "dim_entrada": dim_yrl,
+        "dim_saida": dim_pt,
+        "config": config,
+        "metricas_validacao": melhor,
+    }, output_projection)
+
+    print(f"\nMelhor validação: R@1={melhor['recall@1']:.3f} R@5={melhor['recall@5']:.3f} MRR={melhor['mrr']:.3f}")
+    print(f"✅ Projeção salva em: {output_projection}")
+    return melhor
+
+def carregar_projecao(caminho=OUTPUT_PROJECTION):
+    """Recria a projeção exportada por treinar()."""
+    salvo = torch.load(caminho, map_location="cpu")
+    config = salvo["config"]
+    modelo = ProjecaoAlinhamento(salvo["dim_entrada"], salvo["dim_saida"], config["arquitetura"], config["dim_oculta"])
+    modelo.load_state_dict(salvo["state_dict"])
+    return modelo.eval()
+
+def main(input_file=INPUT_FILE, cache_dir=CACHE_DIR, output_projection=OUTPUT_PROJECTION, **overrides):
+    if not os.path.exists(input_file):
+        print(f"❌ Arquivo '{input_file}' não encontrado. Execute o extraction_script.py antes.")
+        return
+    return treinar(construir_cache(input_file, cache_dir), output_projection, **overrides)
+
+if __name__ == "__main__":
+    main()
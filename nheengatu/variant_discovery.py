@@ -0,0 +1,218 @@
+import csv
+import json
+import unicodedata
+from collections import defaultdict
+from .normalizer import clean_text_nheengatu
+
+# Configuração de Entrada/Saída
+INPUT_FILE = "dataset_nheengatu_expandido.json"
+OUTPUT_JSON = "clusters_variantes.json"
+OUTPUT_CSV = "clusters_variantes.csv"
+
+# Parâmetros da busca
+TAMANHO_NGRAMA = 3
+MAX_FREQ_NGRAMA = 500   # n-gramas mais frequentes que isso não geram candidatos (ex: '#ka')
+MIN_DICE = 0.3          # sobreposição mínima de n-gramas para um par virar candidato
+MAX_DISTANCIA = 0.25    # distância de edição ponderada máxima (normalizada pelo tamanho)
+# Limite absoluto (estrito): nenhum par pode exigir uma edição de custo cheio (1.0).
+# Sem ele, qualquer troca em palavras de 4 letras passaria (1.0/4 <= 0.25): mira / pira
+MAX_DISTANCIA_ABSOLUTA = 1.0
+
+# Custos de substituição específicos do Nheengatu (o padrão é 1.0).
+# Pares que costumam alternar entre grafias de diferentes épocas/autores.
+CUSTOS_SUBSTITUICAO = {
+    frozenset("ck"): 0.2,   # cuára / kuara
+    frozenset("qk"): 0.2,
+    frozenset("uw"): 0.2,   # uasú / wasu
+    frozenset("çs"): 0.2,   # çuaiá / suaiá
+    frozenset("cs"): 0.4,   # ce / se
+    frozenset("iy"): 0.4,   # i / y (vogal alta central)
+    frozenset("ei"): 0.6,
+    frozenset("ou"): 0.6,
+}
+
+# Inserir/remover esses caracteres custa menos que uma letra comum
+CUSTOS_INDEL = {
+    "'": 0.3,   # oclusiva glotal (nhe'eng / nheeng)
+    "-": 0.3,
+    " ": 0.5,
+    "h": 0.6,
+}
+
+def remover_diacriticos(char):
+    """Retorna a letra base (ex: 'ã' -> 'a', 'ĩ' -> 'i')."""
+    decomposto = unicodedata.normalize('NFD', char)
+    return ''.join(c for c in decomposto if not unicodedata.combining(c)) or char
+
+def custo_substituicao(a, b):
+    """Custo de trocar o caractere 'a' por 'b'."""
+    if a == b:
+        return 0.0
+    # Pares da tabela antes de remover diacríticos: 'ç' se decompõe em c + cedilha
+    if frozenset((a, b)) in CUSTOS_SUBSTITUICAO:
+        return CUSTOS_SUBSTITUICAO[frozenset((a, b))]
+    base_a, base_b = remover_diacriticos(a), remover_diacriticos(b)
+    # Mesma letra com/sem acento ou marca nasal (a/ã/á, i/ĩ, u/ũ...)
+    if base_a == base_b:
+        return 0.1
+    return CUSTOS_SUBSTITUICAO.get(frozenset((base_a, base_b)), 1.0)
+
+def custo_indel(char):
+    return CUSTOS_INDEL.get(char, 1.0)
+
+def distancia_ponderada(a, b):
+    """Distância de edição (Levenshtein) com os custos do Nheengatu."""
+    anterior = [0.0]
+    for cb in b:
+        anterior.append(anterior[-1] + custo_indel(cb))
+
+    for ca in a:
+        atual = [anterior[0] + custo_indel(ca)]
+        for j, cb in enumerate(b, start=1):
+            atual.append(min(
+                anterior[j] + custo_indel(ca),                    # remoção
+                atual[j - 1] + custo_indel(cb),                   # inserção
+                anterior[j - 1] + custo_substituicao(ca, cb),     # substituição
+            ))
+        anterior = atual
+    return anterior[-1]
+
+def dobrar_ortografia(palavra):
+    """
+    Chave ortográfica usada apenas para indexar: remove diacríticos e
+    unifica letras que alternam entre grafias, para que cuára e kuara
+    compartilhem n-gramas.
+    """
+    # 'ç' vira 's' antes de remover diacríticos (senão viraria 'c' e depois 'k')
+    base = ''.join(remover_diacriticos(c) for c in palavra.replace("ç", "s"))
+    for origem, destino in (("qu", "k"), ("c", "k"), ("w", "u"), ("y", "i"), ("'", ""), ("-", "")):
+        base = base.replace(origem, destino)
+    return base
+
+def ngramas(texto, n=TAMANHO_NGRAMA):
+    """Conjunto de n-gramas de caracteres com marcadores de borda ('#')."""
+    texto = f"#{texto}#"
+    if len(texto) <= n:
+        return {texto}
+    return {texto[i:i + n] for i in range(len(texto) - n + 1)}
+
+def construir_indice(formas, n=TAMANHO_NGRAMA):
+    """Índice invertido: n-grama -> lista de ids das formas que o contêm."""
+    indice = defaultdict(list)
+    grams_por_forma = []
+    for i, forma in enumerate(formas):
+        grams = ngramas(dobrar_ortografia(forma), n)
+        grams_por_forma.append(grams)
+        for g in grams:
+            indice[g].append(i)
+    return indice, grams_por_forma
+
+def gerar_candidatos(indice, grams_por_forma, max_freq=MAX_FREQ_NGRAMA, min_dice=MIN_DICE):
+    """
+    Gera pares candidatos percorrendo apenas as listas do índice invertido
+    (sem comparar todos os pares). Retorna pares (i, j) com i < j.
+    """
+    for i, grams in enumerate(grams_por_forma):
+        compartilhados = defaultdict(int)
+        for g in grams:
+            postagens = indice[g]
+            if len(postagens) > max_freq:
+                continue
+            for j in postagens:
+                if j > i:
+                    compartilhados[j] += 1
+
+        for j, comuns in compartilhados.items():
+            dice = 2 * comuns / (len(grams) + len(grams_por_forma[j]))
+            if dice >= min_dice:
+                yield i, j
+
+def agrupar(n, pares):
+    """Union-find: junta os pares aceitos em clusters."""
+    pai = list(range(n))
+
+    def raiz(x):
+        while pai[x] != x:
+            pai[x] = pai[pai[x]]
+            x = pai[x]
+        return x
+
+    for i, j in pares:
+        ri, rj = raiz(i), raiz(j)
+        if ri != rj:
+            pai[rj] = ri
+
+    grupos = defaultdict(list)
+    for i in range(n):
+        grupos[raiz(i)].append(i)
+    return [membros for membros in grupos.values() if len(membros) > 1]
+
+def descobrir_variantes(formas, max_distancia=MAX_DISTANCIA, max_distancia_absoluta=MAX_DISTANCIA_ABSOLUTA, **kwargs):
+    """
+    Retorna (clusters, pares) de formas que parecem grafias da mesma palavra.
+    Cada par traz a distância ponderada normalizada pelo tamanho da maior forma;
+    a distância absoluta precisa ficar abaixo de max_distancia_absoluta.
+    """
+    formas = sorted(set(formas))
+    indice, grams_por_forma = construir_indice(formas)
+
+    pares = []
+    for i, j in gerar_candidatos(indice, grams_por_forma, **kwargs):
+        a, b = formas[i], formas[j]
+        absoluta = distancia_ponderada(a, b)
+        distancia = absoluta / max(len(a), len(b))
+        if absoluta < max_distancia_absoluta and distancia <= max_distancia:
+            pares.append((i, j, distancia))
+
+    clusters = [[formas[i] for i in membros] for membros in agrupar(len(formas), [(i, j) for i, j, _ in pares])]
+    pares = [(formas[i], formas[j], d) for i, j, d in pares]
+    return clusters, pares
+
+def main(input_file=INPUT_FILE, output_json=OUTPUT_JSON, output_csv=OUTPUT_CSV):
+    try:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            dataset = json.load(f)
+    except FileNotFoundError:
+        print(f"❌ Arquivo '{input_file}' não encontrado. Execute o pipeline_v2_augment.py antes.")
+        return
+
+    # Significados de cada forma, para ajudar a revisão humana
+    significados = defaultdict(set)
+    for item in dataset:
+        forma = clean_text_nheengatu(item.get('nheengatu_text', ''))
+        if forma:
+            significados[forma].add(item.get('portuguese_text', ''))
+
+    print(f"--- Buscando variantes entre {len(significados)} formas normalizadas ---")
+    clusters, pares = descobrir_variantes(list(significados))
+
+    distancias = {}
+    for a, b, d in pares:
+        distancias[a] = min(distancias.get(a, d), d)
+        distancias[b] = min(distancias.get(b, d), d)
+
+    saida = []
+    for cid, membros in enumerate(sorted(clusters, key=len, reverse=True), start=1):
+        saida.append({
+            "cluster": cid,
+            "formas": membros,
+            "significados": {m: sorted(significados[m]) for m in membros},
+        })
+        print(f"[{cid:>4}] {' | '.join(membros)}")
+
+    with open(output_json, 'w', encoding='utf-8') as f:
+        json.dump(saida, f, ensure_ascii=False, indent=2)
+
+    # Uma linha por forma, para revisão no Excel
+    with open(output_csv, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(["Cluster", "Forma", "Menor_Distancia", "Significados"])
+        for c in saida:
+            for forma in c["formas"]:
+                writer.writerow([c["cluster"], forma, f"{distancias[forma]:.4f}", ", ".join(c["significados"][forma])])
+
+    print(f"\n✅ {len(saida)} clusters ({len(pares)} pares) salvos em: {output_json}")
+    print(f"📊 Tabela para revisão salva em: {output_csv}")
+
+if __name__ == "__main__":
+    main()
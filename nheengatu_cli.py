@@ -0,0 +1,6 @@
+"""Atalho para `python nheengatu_cli.py`: o código está em nheengatu/cli.py."""
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("nheengatu.cli", run_name="__main__")
+else:
+    from nheengatu.cli import *  # noqa: F401,F403
@@ -0,0 +1,6 @@
+"""Atalho para `python pll_scoring.py`: o código está em nheengatu/pll_scoring.py."""
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("nheengatu.pll_scoring", run_name="__main__")
+else:
+    from nheengatu.pll_scoring import *  # noqa: F401,F403
@@ -0,0 +1,6 @@
+"""Atalho para `python static_embeddings.py`: o código está em nheengatu/static_embeddings.py."""
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("nheengatu.static_embeddings", run_name="__main__")
+else:
+    from nheengatu.static_embeddings import *  # noqa: F401,F403
@@ -0,0 +1,61 @@
+from nheengatu.incremental_diff import chave_linha, detectar_mudancas, aplicar_patch
+
+ARQUIVO = "planilha.xlsx"
+
+def _chaves(conteudos):
+    """{chave: hash} de uma planilha cujas linhas (a partir da 2) têm os conteúdos dados."""
+    return {chave_linha(ARQUIVO, linha): h for linha, h in enumerate(conteudos, start=2)}
+
+def _itens(conteudos):
+    return [{"metadata": {"source_file": ARQUIVO, "source_line": linha}, "vetor": h}
+            for linha, h in enumerate(conteudos, start=2)]
+
+def _atualizar(antes, depois):
+    """Aplica detectar_mudancas + aplicar_patch e devolve (mudanças, [(linha, conteúdo)])."""
+    atuais, anteriores = _chaves(depois), _chaves(antes)
+    adicionadas, alteradas, removidas, movidas = detectar_mudancas(atuais, anteriores)
+    origens = {chave_linha(ARQUIVO, linha): (ARQUIVO, linha) for linha in range(2, len(depois) + 2)}
+    ordem = {chave: i for i, chave in enumerate(atuais)}
+    reprocessar = set(adicionadas) | set(alteradas)
+    novos = [i for i in _itens(depois) if chave_linha(ARQUIVO, i["metadata"]["source_line"]) in reprocessar]
+    itens = aplicar_patch(_itens(antes), novos, set(adicionadas) | set(alteradas) | set(removidas),
+                          ordem, movidas, origens)
+    return (adicionadas, alteradas, removidas, movidas), [(i["metadata"]["source_line"], i["vetor"]) for i in itens]
+
+def test_nada_mudou():
+    (adicionadas, alteradas, removidas, movidas), itens = _atualizar(["A", "B"], ["A", "B"])
+    assert (adicionadas, alteradas, removidas, movidas) == ([], [], [], {})
+    assert itens == [(2, "A"), (3, "B")]
+
+def test_insercao_no_meio():
+    (adicionadas, alteradas, removidas, movidas), itens = _atualizar(["A", "B", "C"], ["A", "N", "B", "C"])
+    # Só a linha nova é reprocessada; B e C apenas mudam de linha
+    assert alteradas == [chave_linha(ARQUIVO, 3)]
+    assert adicionadas == [] and removidas == []
+    assert movidas == {chave_linha(ARQUIVO, 3): chave_linha(ARQUIVO, 4),
+                       chave_linha(ARQUIVO, 4): chave_linha(ARQUIVO, 5)}
+    assert itens == [(2, "A"), (3, "N"), (4, "B"), (5, "C")]
+
+def test_remocao():
+    (adicionadas, alteradas, removidas, movidas), itens = _atualizar(["A", "B", "C"], ["B", "C"])
+    assert adicionadas == [] and alteradas == []
+    assert removidas == [chave_linha(ARQUIVO, 2)]
+    assert itens == [(2, "B"), (3, "C")]
+
+def test_troca_de_linhas():
+    (adicionadas, alteradas, removidas, movidas), itens = _atualizar(["A", "B", "C"], ["B", "A", "C"])
+    assert (adicionadas, alteradas, removidas) == ([], [], [])
+    assert movidas == {chave_linha(ARQUIVO, 2): chave_linha(ARQUIVO, 3),
+                       chave_linha(ARQUIVO, 3): chave_linha(ARQUIVO, 2)}
+    assert itens == [(2, "B"), (3, "A"), (4, "C")]
+
+def test_conteudo_duplicado():
+    # Duas linhas iguais: uma cópia removida não pode levar a outra junto
+    (adicionadas, alteradas, removidas, movidas), itens = _atualizar(["A", "X", "A"], ["A", "A"])
+    assert adicionadas == [] and alteradas == []
+    assert removidas == [chave_linha(ARQUIVO, 3)]
+    assert movidas == {chave_linha(ARQUIVO, 4): chave_linha(ARQUIVO, 3)}
+    assert itens == [(2, "A"), (3, "A")]
+
+def test_caminho_normalizado():
+    assert chave_linha("planilha.xlsx", 2) == chave_linha("./planilha.xlsx", 2)
@@ -0,0 +1,34 @@
+import unicodedata
+
+import pytest
+
+from nheengatu.normalizer import normalize_unicode
+from nheengatu.target_search import localizar_ocorrencias, indexar_alvos, localizar_alvos
+
+ALVOS = ["kuara", "nhe'eng", "pirá", "se ruka", "'a", "uka"]
+
+def _referencia(texto, alvos):
+    """Resultado da busca antiga: uma regex por alvo."""
+    return sorted((alvo, span) for alvo in alvos for span in localizar_ocorrencias(texto, alvo))
+
+@pytest.mark.parametrize("texto", [
+    "Kuara kuaraíta nhe'enga NHE'ENG pirá, se ruka 'a uka yuka",
+    "se ruka se rukana Se Ruka; ukauka uka-uka",
+    "nhe'eng-itá (nhe'eng) nhe'eng'a",
+    "",
+])
+def test_localizar_alvos_igual_a_regex_por_alvo(texto):
+    assert sorted(localizar_alvos(texto, indexar_alvos(ALVOS))) == _referencia(texto, ALVOS)
+
+def test_localizar_alvos_caixa_mista():
+    ocorrencias = localizar_alvos("KUARA Kuara kuara", indexar_alvos(["Kuara"]))
+    assert ocorrencias == [("kuara", (0, 5)), ("kuara", (6, 11)), ("kuara", (12, 17))]
+
+def test_localizar_alvos_texto_nfd():
+    # Transcrições em NFD só casam com os alvos (NFC) depois de normalize_unicode
+    texto = normalize_unicode(unicodedata.normalize("NFD", "o pirá e o Pirá"))
+    assert localizar_alvos(texto, indexar_alvos(["pirá"])) == [("pirá", (2, 6)), ("pirá", (11, 15))]
+
+def test_localizar_alvos_apostrofo_no_meio():
+    texto = "nhe'eng nheeng nhe'enga"
+    assert localizar_alvos(texto, indexar_alvos(["nhe'eng"])) == [("nhe'eng", (0, 7))]
@@ -0,0 +1,43 @@
+import pytest
+
+from nheengatu.variant_discovery import custo_substituicao, dobrar_ortografia, distancia_ponderada, descobrir_variantes
+
+@pytest.mark.parametrize("a, b, custo", [
+    ("a", "a", 0.0),
+    ("a", "ã", 0.1),   # mesma letra com/sem marca nasal
+    ("u", "ú", 0.1),
+    ("c", "k", 0.2),   # cuára / kuara
+    ("q", "k", 0.2),
+    ("u", "w", 0.2),   # uasú / wasu
+    ("ç", "s", 0.2),   # Araçupé / arasupé
+    ("s", "ç", 0.2),
+    ("c", "s", 0.4),
+    ("i", "y", 0.4),
+    ("e", "i", 0.6),
+    ("o", "u", 0.6),
+    ("a", "k", 1.0),
+])
+def test_custo_substituicao(a, b, custo):
+    assert custo_substituicao(a, b) == pytest.approx(custo)
+
+def test_dobrar_ortografia_cedilha():
+    assert dobrar_ortografia("çuaiá") == "suaia"
+    assert dobrar_ortografia("araçupé") == dobrar_ortografia("arasupé")
+
+def test_dobrar_ortografia_grafias_alternativas():
+    assert dobrar_ortografia("cuára") == dobrar_ortografia("kuara")
+    assert dobrar_ortografia("uasú") == dobrar_ortografia("wasu")
+
+def test_distancia_ponderada_cedilha():
+    assert distancia_ponderada("araçupé", "arasupé") == pytest.approx(0.2)
+
+def test_descobrir_variantes_palavras_curtas():
+    # Palavras diferentes a uma única edição de custo cheio não são variantes
+    formas = ["mira", "pira", "pirá", "mirĩ", "tata", "pata", "uka", "yuka", "sasi", "rasi"]
+    clusters, pares = descobrir_variantes(formas)
+    assert clusters == [["pira", "pirá"]]
+    assert [(a, b) for a, b, _ in pares] == [("pira", "pirá")]
+
+def test_descobrir_variantes_grafias_alternativas():
+    clusters, _ = descobrir_variantes(["cuára", "kuara", "nhe'eng", "nheeng", "araçupé", "arasupé"])
+    assert sorted(sorted(c) for c in clusters) == [["arasupé", "araçupé"], ["cuára", "kuara"], ["nhe'eng", "nheeng"]]
@@ -0,0 +1,6 @@
+"""Atalho para `python train_alignment.py`: o código está em nheengatu/train_alignment.py."""
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("nheengatu.train_alignment", run_name="__main__")
+else:
+    from nheengatu.train_alignment import *  # noqa: F401,F403
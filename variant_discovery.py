@@ -0,0 +1,6 @@
+"""Atalho para `python variant_discovery.py`: o código está em nheengatu/variant_discovery.py."""
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("nheengatu.variant_discovery", run_name="__main__")
+else:
+    from nheengatu.variant_discovery import *  # noqa: F401,F403